@@ -4,39 +4,106 @@ This module contains utility functions for handling async operations,
 particularly for stream processing and data conversion.
 """
 
+import asyncio
+import codecs
+import io
 from collections.abc import AsyncGenerator
 
+# Minimum number of lines per batch yielded by async_bytes_to_text_stream
+TEXT_BATCH_LINES = 1024
+
 
 async def async_bytes_to_text_stream(
-    async_bytes_stream: AsyncGenerator[bytes, None], 
-    encoding: str = "utf-8"
-) -> AsyncGenerator[str, None]:
-    """Convert async bytes stream to async text stream.
-    
+    async_bytes_stream: AsyncGenerator[bytes, None],
+    encoding: str = "utf-8",
+) -> AsyncGenerator[list[str], None]:
+    """Convert async bytes stream to an async stream of text line batches.
+
+    Bytes are accumulated in a bytearray and decoded incrementally, so
+    multi-byte characters split across chunks are handled without copying the
+    whole pending buffer for every line. Lines are yielded in batches of at
+    least ``TEXT_BATCH_LINES`` (except the last) so consumers pay the async
+    generator overhead per batch rather than per line.
+
     Args:
         async_bytes_stream: Async generator yielding bytes chunks
         encoding: Text encoding to use (default: utf-8)
-        
+
     Yields:
-        str: Text lines from the stream
+        list[str]: Batches of text lines from the stream
     """
-    buffer = b""
-    
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    buffer = bytearray()
+    batch: list[str] = []
+
     async for chunk in async_bytes_stream:
-        buffer += chunk
-        
-        # Try to decode complete lines
-        while b'\n' in buffer:
-            line, buffer = buffer.split(b'\n', 1)
-            try:
-                yield line.decode(encoding)
-            except UnicodeDecodeError:
-                # Handle encoding errors gracefully
-                yield line.decode(encoding, errors='replace')
-    
+        buffer.extend(chunk)
+
+        # Decode everything up to the last complete line
+        newline = buffer.rfind(b"\n")
+        if newline < 0:
+            continue
+        text = decoder.decode(bytes(buffer[: newline + 1]))
+        del buffer[: newline + 1]
+
+        lines = text.split("\n")
+        lines.pop()  # Empty string after the trailing newline
+        batch.extend(lines)
+        if len(batch) >= TEXT_BATCH_LINES:
+            yield batch
+            batch = []
+
     # Yield any remaining data
-    if buffer:
-        try:
-            yield buffer.decode(encoding)
-        except UnicodeDecodeError:
-            yield buffer.decode(encoding, errors='replace')
+    remainder = decoder.decode(bytes(buffer), final=True)
+    if remainder:
+        batch.append(remainder)
+    if batch:
+        yield batch
+
+
+class AsyncQueueSink(io.RawIOBase):
+    """Raw binary sink that hands every written chunk to an asyncio queue.
+
+    Used behind a buffered writer so synchronous writers (e.g. JSONLStream)
+    can feed an async consumer chunk by chunk instead of accumulating the
+    whole output in memory. Writes are synchronous and never block, so the
+    producer bounds the queue by awaiting ``drain()`` between writes; the
+    consumer calls ``task_done()`` once it has finished with each chunk.
+    """
+
+    def __init__(self, queue: asyncio.Queue[bytes | None], max_pending: int) -> None:
+        """Initialize the sink.
+
+        Args:
+            queue: Queue receiving each written chunk.
+            max_pending: Number of queued chunks above which ``drain()`` waits
+                for the consumer.
+        """
+        super().__init__()
+        self.queue = queue
+        self.max_pending = max_pending
+
+    def writable(self) -> bool:
+        """Return True; the sink is write-only."""
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        """Enqueue a copy of the written chunk.
+
+        Args:
+            data: Bytes-like chunk flushed by the buffered writer.
+
+        Returns:
+            int: Number of bytes accepted.
+        """
+        self.queue.put_nowait(bytes(data))
+        return len(data)
+
+    async def drain(self) -> None:
+        """Wait for the consumer to catch up if too many chunks are queued.
+
+        Once more than ``max_pending`` chunks are waiting, this waits until
+        the consumer has finished with every queued chunk.
+        """
+        if self.queue.qsize() > self.max_pending:
+            await self.queue.join()
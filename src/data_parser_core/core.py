@@ -6,7 +6,9 @@ including the base DataRegistryParserConfig and configuration creation utilities
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -23,3 +25,11 @@ class DataRegistryParserConfig:
     concurrency: int = 10
     # Optional fields for backward compatibility with storage hooks
     config_id: str = ""
+
+    @cached_property
+    def compiled_resource_parsers(self) -> list[tuple[re.Pattern[str], Any]]:
+        """Resource parser patterns compiled once, in configuration order."""
+        return [
+            (re.compile(pattern), parser)
+            for pattern, parser in self.resource_parsers.items()
+        ]
@@ -1,14 +1,75 @@
 """JSONL stream helper for convenient record writing."""
 
-import json
-from typing import Any, TextIO
+import contextlib
+import io
+from collections.abc import Callable
+from typing import IO, Any, cast
+
+import orjson
+
+# Size of the write buffer placed in front of the output stream (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Parsers writing JSONL directly accumulate this many bytes per write (256 KiB)
+WRITE_BATCH_BYTES = 1 << 18
+
+# Serializes a record to compact UTF-8 JSON
+dumps: Callable[[dict[str, Any]], bytes] = orjson.dumps
+
+
+def output_writer(
+    write_stream: IO[bytes] | IO[str],
+) -> Callable[[bytes | bytearray], object]:
+    """Return a function writing UTF-8 JSONL chunks to ``write_stream``.
+
+    Binary streams receive the bytes as they are. Text streams receive them
+    decoded, so they apply their own encoding and newline translation; chunks
+    hold whole lines, so no character is ever split between writes.
+
+    Args:
+        write_stream: Binary or text output stream.
+
+    Returns:
+        Function writing one chunk of UTF-8 encoded JSONL.
+    """
+    if isinstance(write_stream, io.TextIOBase):
+        write_text = write_stream.write
+        return lambda chunk: write_text(chunk.decode("utf-8"))
+    return cast("IO[bytes]", write_stream).write
+
+
+class _NonClosingBufferedWriter(io.BufferedWriter):
+    """Buffered writer that leaves the stream it wraps open.
+
+    ``io.BufferedWriter`` closes its raw stream when it is closed, including
+    when it is garbage collected. JSONLStream does not own the stream it
+    writes to, so closing flushes and then detaches instead.
+    """
+
+    def close(self) -> None:
+        """Flush buffered output and release the wrapped stream unclosed."""
+        # ValueError: already detached, or the stream was closed by its owner
+        with contextlib.suppress(ValueError):
+            self.flush()
+            self.detach()
 
 
 class JSONLStream:
-    """Helper class for writing JSONL records with convenient dict serialization."""
+    """Helper class for writing JSONL records with convenient dict serialization.
 
-    def __init__(self, output_stream: TextIO):
+    Records are serialized to UTF-8 bytes with orjson and written through a
+    buffered writer, so callers must call ``flush()`` or ``close()`` once done.
+    The output stream stays owned by the caller and is never closed.
+    """
+
+    __slots__ = ("_write", "out", "output_stream", "records_written")
+
+    def __init__(self, output_stream: IO[bytes] | io.RawIOBase):
         self.output_stream = output_stream
+        self.out = _NonClosingBufferedWriter(
+            output_stream, buffer_size=WRITE_BUFFER_SIZE
+        )
+        self._write = self.out.write
         self.records_written = 0
 
     def write_record(self, record: dict[str, Any]) -> None:
@@ -17,8 +78,9 @@ class JSONLStream:
         Args:
             record: Dictionary to serialize as JSON and write to stream
         """
-        json.dump(record, self.output_stream, ensure_ascii=False)
-        self.output_stream.write("\n")
+        write = self._write
+        write(dumps(record))
+        write(b"\n")
         self.records_written += 1
 
     def write_records(self, records: list[dict[str, Any]]) -> None:
@@ -27,8 +89,20 @@ class JSONLStream:
         Args:
             records: List of dictionaries to serialize and write
         """
+        write = self._write
+        encode = dumps
         for record in records:
-            self.write_record(record)
+            write(encode(record))
+            write(b"\n")
+        self.records_written += len(records)
+
+    def flush(self) -> None:
+        """Flush buffered output through to the underlying stream."""
+        self.out.flush()
+
+    def close(self) -> None:
+        """Flush buffered output and stop writing, leaving the stream open."""
+        self.out.close()
 
     def get_records_written(self) -> int:
         """Get the total number of records written.
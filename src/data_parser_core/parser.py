@@ -5,26 +5,61 @@ from raw stage to parsed stage using the pipeline bus and parser strategies.
 """
 
 import asyncio
-import hashlib
-import io
-import os
-import re
+import time
+from collections.abc import AsyncGenerator, Callable
 from datetime import UTC, datetime
-from typing import Any
 
 import structlog
+from oc_pipeline_bus import DataPipelineBus
 
 from data_parser_app.app_config import parserConfig
-
-from data_parser_core.async_utils import async_bytes_to_text_stream
+from data_parser_core.async_utils import AsyncQueueSink, async_bytes_to_text_stream
 from data_parser_core.core import DataRegistryParserConfig
 from data_parser_core.exceptions import BundleError, ConfigurationError
 from data_parser_core.jsonl_stream import JSONLStream
-from oc_pipeline_bus import DataPipelineBus
 
 # Get logger for this module
 logger = structlog.get_logger(__name__)
 
+# Upload progress is logged at most once per this many bytes or seconds
+UPLOAD_PROGRESS_LOG_BYTES = 16 << 20
+UPLOAD_PROGRESS_LOG_INTERVAL = 2.0
+
+# Output chunks (up to WRITE_BUFFER_SIZE each) allowed to wait for the uploader
+OUTPUT_QUEUE_CHUNKS = 4
+
+
+def throttled_upload_progress(resource_name: str) -> Callable[[int], None]:
+    """Create an upload progress callback that rate-limits its log events.
+
+    The bus invokes the callback for every uploaded chunk; logging each one
+    floods the logs and runs the structlog processor chain per chunk.
+
+    Args:
+        resource_name: Resource being uploaded, included in the log event.
+
+    Returns:
+        Callback accepting the total number of bytes uploaded so far.
+    """
+    last_logged_bytes = 0
+    last_logged_at = time.monotonic()
+
+    def log_progress(bytes_uploaded: int) -> None:
+        nonlocal last_logged_bytes, last_logged_at
+        now = time.monotonic()
+        if (
+            bytes_uploaded - last_logged_bytes < UPLOAD_PROGRESS_LOG_BYTES
+            and now - last_logged_at < UPLOAD_PROGRESS_LOG_INTERVAL
+        ):
+            return
+        logger.info(
+            "UPLOAD_PROGRESS", resource=resource_name, bytes_uploaded=bytes_uploaded
+        )
+        last_logged_bytes = bytes_uploaded
+        last_logged_at = now
+
+    return log_progress
+
 
 async def run_parser(
     app_config: parserConfig,
@@ -56,40 +91,49 @@ async def run_parser(
         last_stage = change_event.stage
         bid = change_event.bid
 
-        bundle_metadata = data_pipeline_bus.get_bundle_metadata_json(bid, last_stage)
+        # Fetch bundle metadata and the resource list concurrently; both are
+        # blocking round trips to the bus backend
+        bundle_metadata, resources = await asyncio.gather(
+            asyncio.to_thread(
+                data_pipeline_bus.get_bundle_metadata_json, bid, last_stage
+            ),
+            asyncio.to_thread(data_pipeline_bus.get_bundle_resource_list, bid),
+        )
         logger.info(
             "BUNDLE_FOUND", bid=bid, stage=last_stage, bundle_metadata=bundle_metadata
         )
-
-        # Get list of resources
-        resources = data_pipeline_bus.get_bundle_resource_list(bid)
         logger.info("BUNDLE_RESOURCES", bid=bid, resources=resources)
 
         if not resources:
             raise BundleError("No resources to process")
 
-        # Create work queue
-        work_queue = asyncio.Queue()
-        for resource_name in resources:
-            await work_queue.put(
-                {
-                    "resource_name": resource_name,
-                    "bid": bid,
-                    "parser_config": parser_config,
-                }
-            )
-
-        # Create worker tasks
-        workers = [
-            asyncio.create_task(process_resource_worker(work_queue, data_pipeline_bus))
-            for _ in range(parser_config.concurrency)
-        ]
+        # Failed resources are collected so one bad resource does not stop
+        # the others
+        failures: list[tuple[str, Exception]] = []
+        semaphore = asyncio.Semaphore(parser_config.concurrency)
 
-        # Wait for all work to complete
-        await work_queue.join()
-
-        # Wait for workers to finish naturally
-        await asyncio.gather(*workers, return_exceptions=True)
+        async def process_and_release(resource_name: str) -> None:
+            try:
+                await process_resource(
+                    resource_name, bid, parser_config, data_pipeline_bus, failures
+                )
+            finally:
+                semaphore.release()
+
+        # Acquiring before each task is created keeps at most `concurrency`
+        # resources in flight; the task group cancels the rest on any error
+        # that escapes a resource
+        async with asyncio.TaskGroup() as task_group:
+            for resource_name in resources:
+                await semaphore.acquire()
+                task_group.create_task(process_and_release(resource_name))
+
+        if failures:
+            failed_resources = ", ".join(name for name, _ in failures)
+            raise BundleError(
+                f"Failed to parse {len(failures)} resource(s): {failed_resources}",
+                bid=bid,
+            ) from failures[0][1]
 
         # Complete the bundle
         data_pipeline_bus.complete_bundle(
@@ -108,77 +152,104 @@ async def run_parser(
         raise  # Fail fast as requested
 
 
-async def process_resource_worker(
-    work_queue: asyncio.Queue, data_pipeline_bus: DataPipelineBus
+async def process_resource(
+    resource_name: str,
+    bid: str,
+    parser_config: DataRegistryParserConfig,
+    data_pipeline_bus: DataPipelineBus,
+    failures: list[tuple[str, Exception]] | None = None,
 ) -> None:
-    """Worker that processes resources from the queue with streaming."""
-
-    while True:
-        try:
-            # Get work item
-            work_item = await work_queue.get()
-            resource_name = work_item["resource_name"]
-            bid = work_item["bid"]
-            parser_config = work_item["parser_config"]
-
-            # Find parser strategy
-            parser_strategy = None
-
-            for pattern, parser_config_dict in parser_config.resource_parsers.items():
-                if re.match(pattern, resource_name):
-                    # Get the parser strategy (first key in the dict)
-                    parser_strategy = list(parser_config_dict.keys())[0]
-                    break
-
-            if not parser_strategy:
-                raise ConfigurationError(
-                    f"No parser found for resource: {resource_name}"
-                )
+    """Parse a single resource and stream its JSONL output to the pipeline bus.
 
-            # Create streaming pipeline
-            async def create_output_stream():
-                """Convert text stream to bytes for pipeline bus."""
-                output_buffer = io.StringIO()
-                jsonl_stream = JSONLStream(output_buffer)
-
-                # Get async input stream from pipeline bus
-                async_bytes_stream = data_pipeline_bus.get_bundle_resource_stream(bid, resource_name)
-                
-                # Convert async bytes stream to async text stream
-                async_text_stream = async_bytes_to_text_stream(async_bytes_stream)
-
-                # Stream parse with progress updates
-                async for records_written in parser_strategy.parse_stream(
-                    async_text_stream, jsonl_stream
-                ):
-                    logger.info(
-                        "PROGRESS", resource=resource_name, records=records_written
-                    )
+    Args:
+        resource_name: Name of the resource within the bundle.
+        bid: Bundle identifier.
+        parser_config: Parser configuration with resource parsers.
+        data_pipeline_bus: Pipeline bus used to read and write resources.
+        failures: Optional list collecting ``(resource_name, error)`` pairs.
+            When given, a failure is recorded instead of raised.
+    """
 
-                # Convert final output to bytes
-                jsonl_content = output_buffer.getvalue()
-                yield jsonl_content.encode("utf-8")
-
-            # Stream directly to pipeline bus
-            await data_pipeline_bus.add_bundle_resource_streaming(
-                bid,
-                f"{resource_name}.jsonl",
-                {
-                    "source_resource": resource_name,
-                    "parsed_at": datetime.now(UTC).isoformat(),
-                },
-                create_output_stream(),
-                progress_callback=lambda bytes_uploaded: logger.info(
-                    "UPLOAD_PROGRESS",
-                    resource=resource_name,
-                    bytes_uploaded=bytes_uploaded,
-                ),
+    try:
+        # Find parser strategy
+        parser_strategy = None
+
+        for pattern, parser_config_dict in parser_config.compiled_resource_parsers:
+            if pattern.match(resource_name):
+                # Get the parser strategy (first key in the dict)
+                parser_strategy = list(parser_config_dict.keys())[0]
+                break
+
+        if not parser_strategy:
+            raise ConfigurationError(
+                f"No parser found for resource: {resource_name}"
             )
 
-            logger.info("RESOURCE_COMPLETED", resource=resource_name)
+        # Create streaming pipeline
+        async def create_output_stream() -> AsyncGenerator[bytes, None]:
+            """Stream JSONL bytes to the pipeline bus as they are produced."""
+            chunk_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+            sink = AsyncQueueSink(chunk_queue, OUTPUT_QUEUE_CHUNKS)
+            jsonl_stream = JSONLStream(sink)
+
+            async def parse_resource() -> None:
+                try:
+                    # Get async input stream from pipeline bus
+                    async_bytes_stream = (
+                        data_pipeline_bus.get_bundle_resource_stream(
+                            bid, resource_name
+                        )
+                    )
 
-        except Exception as e:
-            logger.exception("WORKER_ERROR", resource=resource_name, error=str(e))
+                    # Convert async bytes stream to async text stream
+                    async_text_stream = async_bytes_to_text_stream(
+                        async_bytes_stream
+                    )
+
+                    # Stream parse with progress updates
+                    async for records_written in parser_strategy.parse_stream(
+                        async_text_stream, jsonl_stream
+                    ):
+                        logger.info(
+                            "PROGRESS",
+                            resource=resource_name,
+                            records=records_written,
+                        )
+                        # Hold the parser back while the uploader catches up
+                        await sink.drain()
+
+                    jsonl_stream.flush()
+                finally:
+                    # Sentinel marks the end of the output
+                    chunk_queue.put_nowait(None)
+
+            parse_task = asyncio.create_task(parse_resource())
+            try:
+                while (chunk := await chunk_queue.get()) is not None:
+                    yield chunk
+                    chunk_queue.task_done()
+                # Surface any parse failure to the uploader
+                await parse_task
+            finally:
+                if not parse_task.done():
+                    parse_task.cancel()
+
+        # Stream directly to pipeline bus
+        await data_pipeline_bus.add_bundle_resource_streaming(
+            bid,
+            f"{resource_name}.jsonl",
+            {
+                "source_resource": resource_name,
+                "parsed_at": datetime.now(UTC).isoformat(),
+            },
+            create_output_stream(),
+            progress_callback=throttled_upload_progress(resource_name),
+        )
+
+        logger.info("RESOURCE_COMPLETED", resource=resource_name)
+
+    except Exception as e:
+        logger.exception("WORKER_ERROR", resource=resource_name, error=str(e))
+        if failures is None:
             raise  # Fail fast - bubble up error
-        finally:
-            work_queue.task_done()
+        failures.append((resource_name, e))
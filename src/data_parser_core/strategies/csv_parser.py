@@ -1,22 +1,43 @@
 """CSV parser strategy implementation."""
 
 import csv
-import io
-import json
+from collections.abc import AsyncGenerator, Callable, Generator, Iterable, Iterator
 from dataclasses import dataclass
-from typing import Any, IO, AsyncGenerator, BinaryIO
+from functools import lru_cache
+from typing import IO, Any, cast
 
-from data_parser_core.jsonl_stream import JSONLStream
-from data_parser_core.strategy_types import ResourceParserStrategy
+from data_parser_core.jsonl_stream import (
+    WRITE_BATCH_BYTES,
+    JSONLStream,
+    dumps,
+    output_writer,
+)
+
+# Read buffer for file-path input (1 MiB), fewer read syscalls on large files
+READ_BUFFER_SIZE = 1 << 20
+
+# Characters str.strip() removes; none lie above U+3000
+_WHITESPACE = frozenset(chr(code) for code in range(0x3001) if chr(code).isspace())
+
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+
+# Coercion callables by target type; other types (e.g. date:<fmt>) are kept as is
+_COERCERS: dict[str, Callable[[str], Any]] = {
+    "int": int,
+    "float": float,
+    "bool": lambda value: value.lower() in _TRUE_VALUES,
+    "str": str,
+}
 
 
 @dataclass
-class CsvResourceParser(ResourceParserStrategy):
+class CsvResourceParser:
     """Parse a delimited text resource (e.g., CSV) into a standard JSONL stream.
 
     Public behavior (implementation details elided):
     - Reads a source identified by `resource_name` (file path, blob key, etc.).
-    - Emits one JSON object per line (JSONL) to `write_stream` using UTF-8 text.
+    - Emits one compact JSON object per line (JSONL) to `write_stream`, as UTF-8
+      bytes for binary streams or as text for text streams.
     - Uses constructor configuration to control delimiter, quoting, headers, type coercions,
       field selection/renaming, and basic validation.
     - Returns the number of JSON records written.
@@ -32,7 +53,7 @@ class CsvResourceParser(ResourceParserStrategy):
     escapechar: str | None = None
     encoding: str = "utf-8"
     line_separator: str = "\n"
-    
+
     # Parsing configuration
     has_header: bool = True
     headers: list[str] | None = None
@@ -50,7 +71,7 @@ class CsvResourceParser(ResourceParserStrategy):
     def parse(
         self,
         resource_name: str,
-        write_stream: IO[str],
+        write_stream: IO[bytes] | IO[str],
     ) -> int:
         """Convert the input resource to JSONL and write to write_stream.
 
@@ -58,8 +79,11 @@ class CsvResourceParser(ResourceParserStrategy):
         ----------
         resource_name : str
             Identifier for the raw input (e.g., file path, object storage key).
-        write_stream : IO[str]
-            A text stream to receive JSONL output. The parser writes one JSON object per line.
+        write_stream : IO[bytes] | IO[str]
+            A stream to receive the JSONL output, one JSON object per line. Binary
+            streams receive UTF-8 bytes; text streams receive decoded text. Records
+            are compact JSON serialized with orjson, without spaces after ``,``
+            and ``:``.
         Returns
         -------
         int
@@ -73,146 +97,168 @@ class CsvResourceParser(ResourceParserStrategy):
         - Handles basic errors per `on_error` policy.
         - Writes normalized objects to `write_stream` as JSONL.
         """
+        chunks = _CountedChunks(self.parse_iter(resource_name))
+        write = output_writer(write_stream)
+        for chunk in chunks:
+            write(chunk)
+        return chunks.records_written
+
+    def parse_iter(self, resource_name: str) -> Generator[bytearray, None, int]:
+        """Convert the input resource to JSONL, yielding the output in chunks.
+
+        Each chunk holds complete JSONL lines, about WRITE_BATCH_BYTES in size,
+        and is not reused afterwards, so consumers can hand it on without
+        copying. Output starts as soon as the first chunk is full rather than
+        when the whole resource has been parsed.
+
+        Args:
+            resource_name: Identifier for the raw input (e.g., file path).
+
+        Yields:
+            Chunks of UTF-8 encoded JSONL output.
+
+        Returns:
+            The number of JSON records written.
+        """
         # Use constructor configuration
-        delimiter = self.delimiter
-        quotechar = self.quotechar
-        escapechar = self.escapechar
-        has_header = self.has_header
-        headers = self.headers
-        include = self.include
-        rename = self.rename or {}
-        coerce = self.coerce or {}
-        null_values = self.null_values or ["", "NULL", "null"]
-        trim_whitespace = self.trim_whitespace
-        skip_rows = self.skip_rows
         limit_rows = self.limit_rows
         on_error = self.on_error
-        extra_fields_policy = self.extra_fields_policy
-        schema_version = self.schema_version
+        line_separator = self.line_separator.encode("utf-8")
 
         records_written = 0
+        # Output is batched into chunks of WRITE_BATCH_BYTES
+        output_buffer = bytearray()
 
+        # Errors opening or reading the resource end parsing unless on_error
+        # is "fail". No handler covers a yield, so closing the generator or
+        # throwing into it is never mistaken for a parse error.
         try:
-            with open(
-                resource_name, "r", encoding=self.encoding, newline=""
-            ) as csvfile:
-                # Create CSV reader
-                reader = csv.reader(
-                    csvfile,
-                    delimiter=delimiter,
-                    quotechar=quotechar,
-                    escapechar=escapechar,
-                )
-
-                # Handle headers
-                if has_header and headers is None:
-                    try:
-                        headers = next(reader)
-                    except StopIteration:
-                        return 0  # Empty file
-                elif headers is None:
-                    # No headers provided and has_header is False
-                    # We'll need to generate generic headers or fail
-                    raise ValueError(
-                        "Either has_header=True or headers must be provided"
-                    )
-
-                # Apply column selection
-                if include:
-                    # Find indices of included columns
-                    include_indices = []
-                    filtered_headers = []
-                    for i, header in enumerate(headers):
-                        if header in include:
-                            include_indices.append(i)
-                            filtered_headers.append(header)
-                    headers = filtered_headers
-                else:
-                    include_indices = list(range(len(headers)))
-
-                # Apply field renaming
-                renamed_headers = [rename.get(h, h) for h in headers]
-
-                # Skip initial rows if requested
-                for _ in range(skip_rows):
-                    try:
-                        next(reader)
-                    except StopIteration:
-                        return 0  # Not enough rows
+            csvfile = open(  # noqa: SIM115 - closed by the with block below
+                resource_name,
+                "r",
+                buffering=READ_BUFFER_SIZE,
+                encoding=self.encoding,
+                newline="",
+            )
+        except Exception:
+            if on_error == "fail":
+                raise
+            return 0
 
-                # Process rows
-                for row_num, row in enumerate(reader):
-                    if limit_rows and records_written >= limit_rows:
-                        break
+        with csvfile:
+            try:
+                source = self._read_source(csvfile)
+            except Exception:
+                if on_error == "fail":
+                    raise
+                return 0
+            if source is None:
+                return 0  # Empty file, or not enough rows
+            rows, process_row = source
+
+            # Bind hot-loop callables to locals
+            encode = dumps
+
+            while not (limit_rows and records_written >= limit_rows):
+                try:
+                    source_row, row = next(rows)
+                except StopIteration:
+                    break
+                except Exception:
+                    if on_error == "fail":
+                        raise
+                    # Stop at unreadable input, keeping the records written
+                    break
 
-                    try:
-                        # Apply column selection
-                        if include_indices:
-                            filtered_row = [
-                                row[i] if i < len(row) else "" for i in include_indices
-                            ]
-                        else:
-                            filtered_row = row
-
-                        # Ensure row has same length as headers
-                        while len(filtered_row) < len(renamed_headers):
-                            filtered_row.append("")
-                        filtered_row = filtered_row[: len(renamed_headers)]
-
-                        # Create record dictionary
-                        record = {}
-                        for header, value in zip(renamed_headers, filtered_row):
-                            # Trim whitespace if requested
-                            if trim_whitespace:
-                                value = value.strip()
-
-                            # Handle null values
-                            if value in null_values:
-                                value = None
-
-                            # Apply type coercion
-                            if value is not None and header in coerce:
-                                value = self._coerce_value(value, coerce[header])
-
-                            record[header] = value
-
-                        # Add schema version if specified
-                        if schema_version:
-                            record["_schema_version"] = schema_version
-
-                        # Add source row metadata
-                        record["oc:source_row"] = str(
-                            row_num + skip_rows + (2 if has_header else 1)
-                        )
-
-                        # Write JSONL line
-                        json_line = json.dumps(record, ensure_ascii=False)
-                        write_stream.write(json_line + self.line_separator)
-                        records_written += 1
+                try:
+                    record = process_row(row)
 
-                    except Exception as e:
-                        if on_error == "fail":
-                            raise
-                        # Skip this row and continue
-                        continue
+                    # Add source row metadata
+                    record["oc:source_row"] = str(source_row)
 
-        except Exception as e:
-            if on_error == "fail":
-                raise
-            # Log error but continue
-            pass
+                    # Write JSONL line
+                    output_buffer += encode(record)
+                except Exception:
+                    if on_error == "fail":
+                        raise
+                    # Skip this row and continue
+                    continue
+
+                output_buffer += line_separator
+                records_written += 1
+                if len(output_buffer) >= WRITE_BATCH_BYTES:
+                    yield output_buffer
+                    output_buffer = bytearray()
+
+        if output_buffer:
+            yield output_buffer
 
         return records_written
 
+    def _read_source(
+        self, csvfile: IO[str]
+    ) -> (
+        tuple[Iterator[tuple[int, list[str]]], Callable[[list[str]], dict[str, Any]]]
+        | None
+    ):
+        """Read past the header and skipped rows of a file being parsed.
+
+        Args:
+            csvfile: Text file opened with ``newline=""``.
+
+        Returns:
+            The remaining rows, numbered as 1-based lines of the source file,
+            and the row processor for the file's columns, or None if the file
+            ends first.
+
+        Raises:
+            ValueError: If there is neither a header row nor ``headers``.
+        """
+        # Create CSV reader
+        reader: Iterator[list[str]]
+        if self.escapechar is None:
+            reader = _split_rows(csvfile, self.delimiter, self.quotechar)
+        else:
+            reader = csv.reader(
+                csvfile,
+                delimiter=self.delimiter,
+                quotechar=self.quotechar,
+                escapechar=self.escapechar,
+            )
+
+        # Handle headers
+        headers = self.headers
+        if self.has_header and headers is None:
+            try:
+                headers = next(reader)
+            except StopIteration:
+                return None  # Empty file
+        elif headers is None:
+            # No headers provided and has_header is False
+            raise ValueError("Either has_header=True or headers must be provided")
+
+        # Skip initial rows if requested
+        for _ in range(self.skip_rows):
+            try:
+                next(reader)
+            except StopIteration:
+                return None  # Not enough rows
+
+        # Specialize the per-row work for this configuration once
+        process_row = self._build_row_fn(headers)
+
+        row_offset = self.skip_rows + (2 if self.has_header else 1)
+        return enumerate(reader, row_offset), process_row
+
     async def parse_stream(
         self,
-        async_input_stream: AsyncGenerator[str, None],
+        async_input_stream: AsyncGenerator[list[str], None],
         jsonl_stream: JSONLStream,
     ) -> AsyncGenerator[int, None]:
         """Stream parse CSV from async input stream to jsonl_stream, yielding progress updates.
 
         Args:
-            async_input_stream: Async generator yielding text lines.
+            async_input_stream: Async generator yielding batches of text lines.
             jsonl_stream: JSONLStream helper for writing records.
 
         Yields:
@@ -222,168 +268,365 @@ class CsvResourceParser(ResourceParserStrategy):
         delimiter = self.delimiter
         quotechar = self.quotechar
         escapechar = self.escapechar
-        has_header = self.has_header
         headers = self.headers
-        include = self.include
-        rename = self.rename or {}
-        coerce = self.coerce or {}
-        null_values = self.null_values or ["", "NULL", "null"]
-        trim_whitespace = self.trim_whitespace
-        skip_rows = self.skip_rows
         limit_rows = self.limit_rows
         on_error = self.on_error
-        extra_fields_policy = self.extra_fields_policy
-        schema_version = self.schema_version
-
-        # Collect all lines first to create CSV reader
-        lines = []
-        async for line in async_input_stream:
-            lines.append(line)
-        
-        if not lines:
-            return
-
-        # Create CSV reader from collected lines
-        import io
-        text_content = "\n".join(lines)
-        text_stream = io.StringIO(text_content)
-        reader = csv.DictReader(
-            text_stream,
+
+        # Built from the header row, as for file parsing
+        process_row: Callable[[list[str]], dict[str, Any]] | None = None
+        rows_to_skip = self.skip_rows
+
+        # Process records
+        records_written = 0
+        batch_size = 1000  # Write and yield progress once 1000 records are pending
+        write_records = jsonl_stream.write_records
+        # Records are written, and progress yielded, between input batches
+        pending: list[dict[str, Any]] = []
+
+        # Records left open at the end of a batch carry over to the next, so
+        # quoted fields may span input batches
+        row_reader = _BatchRowReader(
             delimiter=delimiter,
             quotechar=quotechar,
             escapechar=escapechar,
         )
-
-        # Handle headers
-        if headers:
-            reader.fieldnames = headers
-
-        # Skip rows if specified
-        for _ in range(skip_rows):
+        async for rows in row_reader.read(async_input_stream):
+            # Errors reading the input propagate; parse errors follow on_error
             try:
-                next(reader)
-            except StopIteration:
-                return
+                for row in rows:
+                    if not row:
+                        # Blank lines carry no record
+                        continue
 
-        # Process records
-        records_written = 0
-        batch_size = 1000  # Yield progress every 1000 records
+                    if process_row is None:
+                        # Handle headers
+                        if not headers:
+                            headers = row
+                        process_row = self._build_row_fn(headers)
+                        if headers is row:
+                            continue
+
+                    # Skip rows if specified
+                    if rows_to_skip:
+                        rows_to_skip -= 1
+                        continue
 
-        try:
-            for row in reader:
-                if limit_rows and records_written >= limit_rows:
-                    break
+                    if limit_rows and records_written >= limit_rows:
+                        break
 
-                try:
-                    # Process the row
-                    processed_row = self._process_row(
-                        row, include, rename, coerce, null_values, 
-                        trim_whitespace, extra_fields_policy, schema_version
-                    )
-                    
-                    if processed_row is not None:
-                        jsonl_stream.write_record(processed_row)
+                    try:
+                        pending.append(process_row(row))
                         records_written += 1
+                    except Exception as e:
+                        if on_error == "fail":
+                            raise
+                        # Log error but continue
+                        pass
 
-                        # Yield progress updates
-                        if records_written % batch_size == 0:
-                            yield records_written
+            except Exception as e:
+                if on_error == "fail":
+                    raise
+                # Stop parsing, keeping the records written so far
+                break
 
-                except Exception as e:
-                    if on_error == "fail":
-                        raise
-                    # Log error but continue
-                    pass
+            # Write the pending records and yield progress updates
+            if len(pending) >= batch_size:
+                write_records(pending)
+                pending.clear()
+                yield records_written
 
-        except Exception as e:
-            if on_error == "fail":
-                raise
-            # Log error but continue
-            pass
+            if limit_rows and records_written >= limit_rows:
+                break
+
+        if pending:
+            write_records(pending)
 
         # Yield final count
         if records_written > 0:
             yield records_written
 
+    def _build_row_fn(
+        self, headers: list[str]
+    ) -> Callable[[list[str]], dict[str, Any]]:
+        """Generate a row processor specialized for a fixed configuration.
 
-    def _process_row(
-        self,
-        row: dict[str, str],
-        rename: dict[str, str],
-        coerce: dict[str, str],
-        null_values: list[str],
-        trim_whitespace: bool,
-        extra_fields_policy: str,
-        schema_version: str | None = None,
-    ) -> dict[str, Any]:
-        """Process a single CSV row with transformations.
+        The configuration is constant for a whole parse, so instead of
+        re-checking column selection, trimming, null handling and coercion for
+        every cell, a function with one unrolled statement block per column is
+        compiled once. File and stream parsing both use it, so they transform
+        rows alike. Missing trailing cells are treated as empty strings.
+        Compiled functions are cached, so files sharing a schema reuse the
+        same one.
 
         Args:
-            row: Raw CSV row data.
-            rename: Field rename mapping.
-            coerce: Type coercion mapping.
-            null_values: Values to treat as null.
-            trim_whitespace: Whether to trim whitespace.
-            extra_fields_policy: How to handle extra fields.
-            schema_version: Optional schema version to include.
+            headers: Source column names, in file order.
 
         Returns:
-            Processed row as dictionary.
+            Function converting a raw CSV row into a record dictionary.
         """
-        processed_row = {}
+        include_set = frozenset(self.include) if self.include else None
+        rename = self.rename or {}
+        coerce = self.coerce or {}
+        drop_extra_fields = self.extra_fields_policy == "drop"
 
-        for field, value in row.items():
-            # Skip extra fields if policy is "drop"
-            if extra_fields_policy == "drop" and field not in rename:
+        columns = []
+        for index, field in enumerate(headers):
+            if include_set is not None and field not in include_set:
+                continue
+            if drop_extra_fields and field not in rename:
                 continue
-
-            # Apply field rename
             output_field = rename.get(field, field)
+            # Coercions are keyed by output field, or by source column
+            target_type = coerce.get(output_field, coerce.get(field))
+            columns.append((output_field, index, target_type))
+
+        return _compile_row_fn(
+            tuple(columns),
+            frozenset(self.null_values or ("", "NULL", "null")),
+            self.trim_whitespace,
+            self.schema_version,
+        )
 
-            # Trim whitespace if configured
-            if trim_whitespace and isinstance(value, str):
-                value = value.strip()
 
-            # Handle null values
-            if value in null_values:
-                value = None
-            elif value and field in coerce:
-                # Apply type coercion
-                try:
-                    value = self._coerce_value(value, coerce[field])
-                except (ValueError, TypeError):
-                    # If coercion fails, keep original value
-                    pass
+@lru_cache(maxsize=64)
+def _compile_row_fn(
+    columns: tuple[tuple[str, int, str | None], ...],
+    null_set: frozenset[str],
+    trim_whitespace: bool,
+    schema_version: str | None,
+) -> Callable[[list[str]], dict[str, Any]]:
+    """Compile the row processor for a fixed column layout.
+
+    Args:
+        columns: Output field name, source column index and optional coercion
+            type for each output column.
+        null_set: Values to treat as null.
+        trim_whitespace: Whether to trim whitespace.
+        schema_version: Optional schema version to include.
+
+    Returns:
+        Function converting a raw CSV row into a new record dictionary.
+    """
+    namespace: dict[str, Any] = {
+        "NULLS": null_set,
+        "SCHEMA": schema_version,
+        "WS": _WHITESPACE,
+    }
+    body = ["def process_row(row):", "    n = len(row)"]
+    fields = []
+    for position, (header, index, target_type) in enumerate(columns):
+        value = f"v{position}"
+        body.append(f'    {value} = row[{index}] if {index} < n else ""')
+        if trim_whitespace:
+            # Most cells are already clean, so only strip when an end is blank
+            body.append(
+                f"    if {value} and ({value}[0] in WS or {value}[-1] in WS):"
+                f" {value} = {value}.strip()"
+            )
+        coercer = _COERCERS.get(target_type) if target_type else None
+        if coercer is None:
+            body.append(f"    if {value} in NULLS: {value} = None")
+        else:
+            namespace[f"C{position}"] = coercer
+            body.append(
+                f"    {value} = None if {value} in NULLS else C{position}({value})"
+            )
+        fields.append(f"{header!r}: {value}")
+    if schema_version:
+        fields.append('"_schema_version": SCHEMA')
+    body.append(f"    return {{{', '.join(fields)}}}")
+
+    exec("\n".join(body), namespace)  # noqa: S102 - source built from repr() literals
+    return cast("Callable[[list[str]], dict[str, Any]]", namespace["process_row"])
+
+
+class _CountedChunks:
+    """Iterate the chunks of ``parse_iter``, keeping the count it returns."""
+
+    __slots__ = ("_chunks", "records_written")
 
-            processed_row[output_field] = value
+    def __init__(self, chunks: Generator[bytearray, None, int]) -> None:
+        self._chunks = chunks
+        self.records_written = 0
 
-        # Add schema version if provided
-        if schema_version:
-            processed_row["_schema_version"] = schema_version
+    def __iter__(self) -> Iterator[bytearray]:
+        self.records_written = yield from self._chunks
 
-        return processed_row
 
-    def _coerce_value(self, value: str, target_type: str) -> Any:
-        """Coerce a string value to the target type.
+class _BatchRowReader:
+    """CSV rows from input that arrives as batches of lines.
+
+    Each batch is parsed with its own ``csv.reader`` on the event loop. A
+    record still open at the end of a batch (a quoted field continuing on the
+    next line) is carried over and parsed again ahead of the next batch, so
+    quoted fields may span batches just as if the input were one iterable.
+    """
+
+    def __init__(
+        self, delimiter: str, quotechar: str | None, escapechar: str | None
+    ) -> None:
+        """Initialize the reader.
 
         Args:
-            value: The string value to coerce.
-            target_type: The target type (int, float, bool, date:<fmt>, str).
+            delimiter: Field delimiter.
+            quotechar: Quote character.
+            escapechar: Escape character, if any.
+        """
+        self._delimiter = delimiter
+        self._quotechar = quotechar
+        self._escapechar = escapechar
+        # Lines of the record left open by the last batch
+        self._carry: list[str] = []
+
+    async def read(
+        self, async_input_stream: AsyncGenerator[list[str], None]
+    ) -> AsyncGenerator[Iterable[list[str]], None]:
+        """Read batches from an input stream, yielding the rows each completes.
+
+        A record still open at the end of a batch is returned with the batch
+        that completes it. An error raised by ``csv.reader`` is raised while
+        iterating the rows of the batch it occurred in, after the rows read
+        before it, and ends the stream.
 
-        Returns:
-            The coerced value.
+        Args:
+            async_input_stream: Async generator yielding batches of text lines.
+
+        Yields:
+            The rows completed by each batch, then any unterminated final row.
         """
-        if target_type == "int":
-            return int(value)
-        elif target_type == "float":
-            return float(value)
-        elif target_type == "bool":
-            return value.lower() in ("true", "1", "yes", "on")
-        elif target_type.startswith("date:"):
-            # For now, just return the string value
-            # In a real implementation, you'd parse the date format
-            return value
-        elif target_type == "str":
-            return str(value)
+        quotechar = self._quotechar
+        async for line_batch in async_input_stream:
+            if (
+                self._carry
+                and self._escapechar is None
+                and quotechar is not None
+                and not any(quotechar in line for line in line_batch)
+            ):
+                # Only a quote can close the open quoted field, so skip
+                # re-parsing it for every batch of an unterminated quote
+                self._carry += line_batch
+                continue
+            rows, error = self._read_rows(self._carry + line_batch, final=False)
+            if error is not None:
+                yield _rows_then_raise(rows, error)
+                return
+            yield rows
+
+        if self._carry:
+            rows, error = self._read_rows(self._carry, final=True)
+            yield rows if error is None else _rows_then_raise(rows, error)
+
+    def _read_rows(
+        self, lines: list[str], *, final: bool
+    ) -> tuple[list[list[str]], csv.Error | None]:
+        """Parse ``lines``, carrying an open final record unless ``final``."""
+        batch = _BatchLines(lines)
+        reader = csv.reader(
+            batch,
+            delimiter=self._delimiter,
+            quotechar=self._quotechar,
+            escapechar=self._escapechar,
+        )
+        rows: list[list[str]] = []
+        self._carry = []
+        try:
+            while True:
+                start = batch.position
+                try:
+                    row = next(reader)
+                except StopIteration:
+                    row = None
+                if batch.exhausted and not final and batch.position > start:
+                    # The reader ran out of lines inside this record
+                    self._carry = lines[start:]
+                    break
+                if row is None:
+                    break
+                rows.append(row)
+        except csv.Error as error:
+            return rows, error
+        return rows, None
+
+
+class _BatchLines:
+    """Line iterator over one batch that notes when the batch runs out."""
+
+    __slots__ = ("_lines", "exhausted", "position")
+
+    def __init__(self, lines: list[str]) -> None:
+        self._lines = lines
+        self.position = 0
+        self.exhausted = False
+
+    def __iter__(self) -> "_BatchLines":
+        return self
+
+    def __next__(self) -> str:
+        position = self.position
+        if position == len(self._lines):
+            self.exhausted = True
+            raise StopIteration
+        self.position = position + 1
+        # Batches hold lines without their newline
+        return self._lines[position] + "\n"
+
+
+def _rows_then_raise(rows: list[list[str]], error: Exception) -> Iterator[list[str]]:
+    """Yield ``rows``, then raise ``error``."""
+    yield from rows
+    raise error
+
+
+class _PushbackLines:
+    """Line iterator over a file that can hand one line back to its reader."""
+
+    __slots__ = ("_lines", "_pushed")
+
+    def __init__(self, lines: Iterator[str]) -> None:
+        self._lines = lines
+        self._pushed: str | None = None
+
+    def push(self, line: str) -> None:
+        """Make ``line`` the next line returned."""
+        self._pushed = line
+
+    def __iter__(self) -> "_PushbackLines":
+        return self
+
+    def __next__(self) -> str:
+        line = self._pushed
+        if line is not None:
+            self._pushed = None
+            return line
+        return next(self._lines)
+
+
+def _split_rows(
+    csvfile: IO[str], delimiter: str, quotechar: str | None
+) -> Iterator[list[str]]:
+    """Read CSV rows, splitting lines without quotes on the delimiter directly.
+
+    Most lines of a typical CSV contain no quote character, and for those a
+    plain ``str.split`` is equivalent to ``csv.reader`` and avoids its
+    per-character state machine. Lines with a quote are handed to a
+    ``csv.reader`` sharing the same file, so it can consume the continuation
+    lines of multi-line quoted fields. Only valid without an escape character.
+
+    Args:
+        csvfile: Text file opened with ``newline=""``.
+        delimiter: Field delimiter.
+        quotechar: Quote character, or None when fields are never quoted.
+
+    Yields:
+        The fields of each row.
+    """
+    lines = _PushbackLines(csvfile)
+    reader = csv.reader(lines, delimiter=delimiter, quotechar=quotechar)
+    for line in csvfile:
+        if quotechar and quotechar in line:
+            lines.push(line)
+            yield next(reader)
         else:
-            return value
+            line = line.rstrip("\r\n")
+            # csv.reader returns no fields for a blank line
+            yield line.split(delimiter) if line else []
@@ -1,16 +1,22 @@
 """Fixed-width parser strategy implementation."""
 
-import io
-import json
+import hashlib
+from collections.abc import AsyncGenerator, Callable
 from dataclasses import dataclass
-from typing import Any, IO, AsyncGenerator, BinaryIO
+from functools import lru_cache
+from itertools import islice
+from typing import IO, Any, cast
 
-from data_parser_core.jsonl_stream import JSONLStream
-from data_parser_core.strategy_types import ResourceParserStrategy
+from data_parser_core.jsonl_stream import (
+    WRITE_BATCH_BYTES,
+    JSONLStream,
+    dumps,
+    output_writer,
+)
 
 
 @dataclass
-class FixedWidthResourceParser(ResourceParserStrategy):
+class FixedWidthResourceParser:
     """Parse a fixed-width text resource into a standard JSONL stream.
 
     This parser handles fixed-width text files where fields are positioned at
@@ -20,7 +26,7 @@ class FixedWidthResourceParser(ResourceParserStrategy):
     # Basic configuration
     encoding: str = "utf-8"
     line_separator: str = "\n"
-    
+
     # Parsing configuration
     field_specs: list[dict[str, Any]] | None = None
     skip_rows: int = 0
@@ -32,7 +38,7 @@ class FixedWidthResourceParser(ResourceParserStrategy):
     def parse(
         self,
         resource_name: str,
-        write_stream: IO[str],
+        write_stream: IO[bytes] | IO[str],
     ) -> int:
         """Convert the input resource to JSONL and write to write_stream.
 
@@ -40,8 +46,11 @@ class FixedWidthResourceParser(ResourceParserStrategy):
         ----------
         resource_name : str
             Identifier for the raw input (e.g., file path, object storage key).
-        write_stream : IO[str]
-            A text stream to receive JSONL output. The parser writes one JSON object per line.
+        write_stream : IO[bytes] | IO[str]
+            A stream to receive the JSONL output, one JSON object per line. Binary
+            streams receive UTF-8 bytes; text streams receive decoded text. Records
+            are compact JSON serialized with orjson, without spaces after ``,``
+            and ``:``.
 
         Returns
         -------
@@ -56,136 +65,158 @@ class FixedWidthResourceParser(ResourceParserStrategy):
         limit_rows = self.limit_rows
         on_error = self.on_error
         schema_version = self.schema_version
-        ocid_generator = self.ocid_generator or {}
+        generate_ocid = self._build_ocid_generator(self.ocid_generator)
+        parse_line = self._build_line_parser(field_specs, schema_version)
+        line_separator = self.line_separator.encode("utf-8")
+        process_line = self._process_line
+        encode = dumps
+        write = output_writer(write_stream)
 
         records_written = 0
+        # Output is batched so write_stream sees one write per WRITE_BATCH_BYTES
+        output_buffer = bytearray()
 
-        try:
-            with open(resource_name, "r", encoding=self.encoding) as file:
-                lines = file.readlines()
-
-                # Skip initial rows if requested
-                start_line = skip_rows
-                end_line = len(lines)
-                if limit_rows:
-                    end_line = min(start_line + limit_rows, len(lines))
-
-                for line_num, line in enumerate(
-                    lines[start_line:end_line], start=start_line + 1
-                ):
-                    try:
-                        # Parse the fixed-width line
-                        record = self._parse_fixed_width_line(
-                            line.rstrip("\n\r"), field_specs
-                        )
-
-                        # Add schema version if specified
-                        if schema_version:
-                            record["_schema_version"] = schema_version
-
-                        # Add source row metadata
-                        record["oc:source_row"] = str(line_num)
-
-                        # Generate OCID if ocid_generator is configured
-                        if ocid_generator:
-                            ocid = self._generate_ocid(record, ocid_generator)
-                            record["oc:ocid"] = ocid
-
-                        # Write JSONL line
-                        json_line = json.dumps(record, ensure_ascii=False)
-                        write_stream.write(json_line + self.line_separator)
-                        records_written += 1
+        with open(resource_name, "r", encoding=self.encoding) as file:
+            # Skip initial rows and apply the limit while streaming lines
+            end_line = skip_rows + limit_rows if limit_rows else None
+            lines = islice(file, skip_rows, end_line)
 
-                    except Exception as e:
-                        if on_error == "fail":
-                            raise
-                        # Skip this row and continue
-                        continue
+            for line_num, line in enumerate(lines, start=skip_rows + 1):
+                try:
+                    # Parse the fixed-width line
+                    record = process_line(line, line_num, parse_line, generate_ocid)
 
-        except Exception as e:
-            if on_error == "fail":
-                raise
-            # Log error but continue
-            pass
+                    # Write JSONL line
+                    output_buffer += encode(record)
+                    output_buffer += line_separator
+                    records_written += 1
+                    if len(output_buffer) >= WRITE_BATCH_BYTES:
+                        write(output_buffer)
+                        output_buffer.clear()
 
-        return records_written
+                except Exception as e:
+                    if on_error == "fail":
+                        raise
+                    # Skip this row and continue
+                    continue
 
+        if output_buffer:
+            write(output_buffer)
 
-    def _parse_fixed_width_line(
-        self, line: str, field_specs: list[dict[str, Any]]
-    ) -> dict[str, Any]:
-        """Parse a single fixed-width line into a dictionary.
+        return records_written
+
+    def _build_line_parser(
+        self, field_specs: list[dict[str, Any]], schema_version: str | None = None
+    ) -> Callable[[str], dict[str, Any]]:
+        """Build a line parser specialized for the given field specifications.
 
         Args:
-            line: The line to parse.
-            field_specs: List of field specifications with 'name', 'start', and 'length' keys.
+            field_specs: List of field specifications with 'name', 'start' (1-based)
+                and 'length' keys.
+            schema_version: Optional schema version added to every record.
 
         Returns:
-            Dictionary with parsed field values.
+            Function parsing a fixed-width line into a dictionary of field values.
         """
-        record = {}
-
-        for field_spec in field_specs:
-            name = field_spec["name"]
-            start = field_spec["start"] - 1  # Convert to 0-based indexing
-            length = field_spec["length"]
-
-            # Extract the field value
-            end = start + length
-            if start < len(line):
-                value = line[start:end].strip()
-            else:
-                value = ""
+        fields = tuple(
+            (spec["name"], spec["start"] - 1, spec["start"] - 1 + spec["length"])
+            for spec in field_specs
+        )
+        return _compile_line_parser(fields, schema_version or None)
 
-            # Handle null values
-            if not value:
-                value = None
+    def _process_line(
+        self,
+        line: str,
+        line_num: int,
+        parse_line: Callable[[str], dict[str, Any]],
+        generate_ocid: Callable[[dict[str, Any]], str] | None,
+    ) -> dict[str, Any]:
+        """Parse a line into a record with schema, source row and OCID metadata.
 
-            record[name] = value
+        Args:
+            line: The line to parse.
+            line_num: 1-based line number in the source.
+            parse_line: Line parser from `_build_line_parser`.
+            generate_ocid: OCID generator from `_build_ocid_generator`, if any.
 
+        Returns:
+            The record dictionary.
+        """
+        # The line parser adds any schema version
+        record = parse_line(line)
+        record["oc:source_row"] = str(line_num)
+        if generate_ocid is not None:
+            record["oc:ocid"] = generate_ocid(record)
         return record
 
+    def _build_ocid_generator(
+        self, ocid_generator: dict[str, Any] | None
+    ) -> Callable[[dict[str, Any]], str] | None:
+        """Build the OCID generator for the ocid_generator configuration.
 
-    def _generate_ocid(
-        self, record: dict[str, Any], ocid_generator: dict[str, Any]
-    ) -> str:
-        """Generate an OCID for the record based on the ocid_generator configuration.
+        The hash state after the constant ``"<jurisdiction>|"`` prefix is computed
+        once and copied per record, so only the company number is hashed per row.
 
         Args:
-            record: The parsed record data.
-            ocid_generator: Configuration for OCID generation.
+            ocid_generator: Configuration for OCID generation. An optional
+                ``hash_algorithm`` of "blake2b" selects a faster 64-bit BLAKE2b
+                digest; the default "sha256" keeps existing OCIDs stable.
 
         Returns:
-            The generated OCID string.
+            Function generating the OCID string for a parsed record, or None if
+            OCID generation is not configured.
+
+        Raises:
+            ValueError: If hash_algorithm is neither "sha256" nor "blake2b".
         """
-        # For now, return a placeholder OCID
+        if not ocid_generator:
+            return None
+
+        # For now, generate a placeholder OCID
         # In a real implementation, this would use the pipeline bus OCID generator
         # with the configured jurisdiction_code and company_number_field
         jurisdiction_code = ocid_generator.get("jurisdiction_code")
-        if not jurisdiction_code:
-            raise ValueError("jurisdiction_code is required in ocid_generator configuration")
         company_number_field = ocid_generator.get("company_number_field", "COR_NUMBER")
-
-        company_number = record.get(company_number_field, "")
-        if company_number:
+        hash_algorithm = ocid_generator.get("hash_algorithm", "sha256")
+        prefix_hash: Any
+        if hash_algorithm == "blake2b":
+            prefix_hash = hashlib.blake2b(digest_size=8)
+            hex_length = None
+        elif hash_algorithm == "sha256":
+            prefix_hash = hashlib.sha256()
+            hex_length = 16
+        else:
+            # A typo must not silently re-key every OCID with another algorithm
+            raise ValueError(
+                f"Unsupported ocid_generator hash_algorithm {hash_algorithm!r}; "
+                "expected 'sha256' or 'blake2b'"
+            )
+        prefix_hash.update(f"{jurisdiction_code}|".encode())
+
+        def generate_ocid(record: dict[str, Any]) -> str:
+            if not jurisdiction_code:
+                raise ValueError(
+                    "jurisdiction_code is required in ocid_generator configuration"
+                )
+            company_number = record.get(company_number_field, "")
+            if not company_number:
+                return "ocid:v1:co:unknown"
             # Simple hash-based OCID for now
-            import hashlib
+            identifier_hash = prefix_hash.copy()
+            identifier_hash.update(company_number.encode())
+            return f"ocid:v1:co:{identifier_hash.hexdigest()[:hex_length]}"
 
-            identifier = f"{jurisdiction_code}|{company_number}"
-            hash_value = hashlib.sha256(identifier.encode()).hexdigest()[:16]
-            return f"ocid:v1:co:{hash_value}"
-        else:
-            return f"ocid:v1:co:unknown"
+        return generate_ocid
 
     async def parse_stream(
         self,
-        async_input_stream: AsyncGenerator[str, None],
+        async_input_stream: AsyncGenerator[list[str], None],
         jsonl_stream: JSONLStream,
     ) -> AsyncGenerator[int, None]:
         """Stream parse fixed-width data from async input stream to jsonl_stream, yielding progress updates.
 
         Args:
-            async_input_stream: Async generator yielding text lines.
+            async_input_stream: Async generator yielding batches of text lines.
             jsonl_stream: JSONLStream helper for writing records.
 
         Yields:
@@ -196,55 +227,92 @@ class FixedWidthResourceParser(ResourceParserStrategy):
         limit_rows = self.limit_rows
         on_error = self.on_error
         schema_version = self.schema_version
-        ocid_generator = self.ocid_generator or {}
+        generate_ocid = self._build_ocid_generator(self.ocid_generator)
+        parse_line = self._build_line_parser(self.field_specs or [], schema_version)
 
-        # Collect all lines first
-        lines = []
-        async for line in async_input_stream:
-            lines.append(line)
-        
-        if not lines:
-            return
-
-        # Skip rows if specified
-        if skip_rows:
-            lines = lines[skip_rows:]
-
-        # Process records
+        # Process records as batches arrive
         records_written = 0
-        batch_size = 1000  # Yield progress every 1000 records
-
-        try:
-            for line in lines:
+        batch_size = 1000  # Write and yield progress once 1000 records are pending
+        rows_to_skip = skip_rows
+        lines_read = 0
+        process_line = self._process_line
+        write_records = jsonl_stream.write_records
+        # Records are written, and progress yielded, between input batches
+        pending: list[dict[str, Any]] = []
+
+        async for line_batch in async_input_stream:
+            first_line_num = lines_read + 1
+            lines_read += len(line_batch)
+
+            # Skip rows if specified
+            if rows_to_skip:
+                skipped = min(rows_to_skip, len(line_batch))
+                line_batch = line_batch[skipped:]
+                rows_to_skip -= skipped
+                first_line_num += skipped
+
+            for line_num, line in enumerate(line_batch, first_line_num):
                 if limit_rows and records_written >= limit_rows:
                     break
 
                 try:
                     # Process the line
-                    processed_record = self._process_line(
-                        line, schema_version, ocid_generator
+                    processed_record = process_line(
+                        line, line_num, parse_line, generate_ocid
                     )
-                    
+
                     if processed_record is not None:
-                        jsonl_stream.write_record(processed_record)
+                        pending.append(processed_record)
                         records_written += 1
 
-                        # Yield progress updates
-                        if records_written % batch_size == 0:
-                            yield records_written
-
                 except Exception as e:
                     if on_error == "fail":
                         raise
                     # Log error but continue
                     pass
 
-        except Exception as e:
-            if on_error == "fail":
-                raise
-            # Log error but continue
-            pass
+            # Write the pending records and yield progress updates
+            if len(pending) >= batch_size:
+                write_records(pending)
+                pending.clear()
+                yield records_written
+
+            if limit_rows and records_written >= limit_rows:
+                break
+
+        if pending:
+            write_records(pending)
 
         # Yield final count
         if records_written > 0:
             yield records_written
+
+
+@lru_cache(maxsize=64)
+def _compile_line_parser(
+    fields: tuple[tuple[str, int, int], ...],
+    schema_version: str | None = None,
+) -> Callable[[str], dict[str, Any]]:
+    """Compile a straight-line parser for a fixed field layout.
+
+    The generated function slices and strips every field in a single dict
+    literal, so no loop or per-field lookups run per line. Empty fields (or
+    fields past the end of a short line) become None. The trailing line break
+    needs no separate rstrip, as strip() removes it from the last field.
+
+    Args:
+        fields: (name, start, end) tuples with 0-based slice bounds.
+        schema_version: Optional schema version added as "_schema_version".
+
+    Returns:
+        Function parsing a fixed-width line into a new record dictionary.
+    """
+    items = ", ".join(
+        f"{name!r}: line[{start}:{end}].strip() or None" for name, start, end in fields
+    )
+    if schema_version is not None:
+        items += f", '_schema_version': {schema_version!r}"
+    source = f"def parse_line(line):\n    return {{{items}}}"
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)  # noqa: S102 - source built from repr() literals
+    return cast("Callable[[str], dict[str, Any]]", namespace["parse_line"])
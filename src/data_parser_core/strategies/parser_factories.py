@@ -33,9 +33,89 @@ class FixedWidthParserConfig:
     line_separator: str = "\n"
 
 
+# Parser constructor arguments with their defaults when absent from the config
+_CSV_PARAMS: tuple[tuple[str, Any], ...] = (
+    ("delimiter", ","),
+    ("quotechar", '"'),
+    ("escapechar", None),
+    ("encoding", "utf-8"),
+    ("line_separator", "\n"),
+    ("has_header", True),
+    ("headers", None),
+    ("include", None),
+    ("rename", None),
+    ("coerce", None),
+    ("null_values", None),
+    ("trim_whitespace", True),
+    ("skip_rows", 0),
+    ("limit_rows", None),
+    ("on_error", "skip"),
+    ("extra_fields_policy", "keep"),
+    ("schema_version", None),
+)
+
+_FIXED_WIDTH_PARAMS: tuple[tuple[str, Any], ...] = (
+    ("encoding", "utf-8"),
+    ("line_separator", "\n"),
+    ("field_specs", None),
+    ("skip_rows", 0),
+    ("limit_rows", None),
+    ("on_error", "skip"),
+    ("schema_version", None),
+    ("ocid_generator", None),
+)
+
+
+def _extract_params(
+    params: Any, defaults: tuple[tuple[str, Any], ...]
+) -> dict[str, Any]:
+    """Read parser constructor arguments from a config dataclass or dict.
+
+    Args:
+        params: Processed config dataclass, parameter dictionary, or anything
+            else (treated as empty).
+        defaults: (name, default) pairs of the arguments to read.
+
+    Returns:
+        Keyword arguments for the parser constructor.
+    """
+    if is_dataclass(params):
+        return {name: getattr(params, name, default) for name, default in defaults}
+    params_dict = params if isinstance(params, dict) else {}
+    return {name: params_dict.get(name, default) for name, default in defaults}
+
+
+def _validate_string_params(
+    params: Any, names: tuple[str, ...], strategy_cls: type, strategy_name: str
+) -> None:
+    """Check that the named parameters, where provided, are strings.
+
+    Args:
+        params: Dictionary of parameters to validate (other types are skipped).
+        names: Names of the parameters that must be strings.
+        strategy_cls: Strategy class reported in the exception.
+        strategy_name: Strategy name reported in the exception.
+
+    Raises:
+        InvalidArgumentStrategyException: If a provided parameter is not a string.
+    """
+    params_dict = params if isinstance(params, dict) else {}
+    for name in names:
+        if name in params_dict and not isinstance(params_dict[name], str):
+            raise InvalidArgumentStrategyException(
+                f"{name} must be a string",
+                strategy_cls,
+                strategy_name,
+                params,
+            )
+
+
 class CsvParserFactory(StrategyFactory):
     """Factory for creating CSV parser instances."""
 
+    # Optional parameters that must be strings when provided
+    _STRING_PARAMS = ("delimiter", "quotechar", "encoding")
+
     def validate(self, params: Any) -> None:
         """Validate CSV parser parameters.
         
@@ -45,32 +125,7 @@ class CsvParserFactory(StrategyFactory):
         Raises:
             InvalidArgumentStrategyException: If validation fails
         """
-        params_dict = params if isinstance(params, dict) else {}
-        
-        # Validate optional parameters if provided
-        if "delimiter" in params_dict and not isinstance(params_dict["delimiter"], str):
-            raise InvalidArgumentStrategyException(
-                "delimiter must be a string",
-                CsvResourceParser,
-                "csv",
-                params,
-            )
-        
-        if "quotechar" in params_dict and not isinstance(params_dict["quotechar"], str):
-            raise InvalidArgumentStrategyException(
-                "quotechar must be a string",
-                CsvResourceParser,
-                "csv",
-                params,
-            )
-        
-        if "encoding" in params_dict and not isinstance(params_dict["encoding"], str):
-            raise InvalidArgumentStrategyException(
-                "encoding must be a string",
-                CsvResourceParser,
-                "csv",
-                params,
-            )
+        _validate_string_params(params, self._STRING_PARAMS, CsvResourceParser, "csv")
 
     def create(self, params: Any) -> CsvResourceParser:
         """Create a CSV parser instance.
@@ -81,63 +136,7 @@ class CsvParserFactory(StrategyFactory):
         Returns:
             Created CsvResourceParser instance
         """
-        if is_dataclass(params):
-            delimiter = getattr(params, "delimiter", ",")
-            quotechar = getattr(params, "quotechar", '"')
-            escapechar = getattr(params, "escapechar", None)
-            encoding = getattr(params, "encoding", "utf-8")
-            line_separator = getattr(params, "line_separator", "\n")
-            has_header = getattr(params, "has_header", True)
-            headers = getattr(params, "headers", None)
-            include = getattr(params, "include", None)
-            rename = getattr(params, "rename", None)
-            coerce = getattr(params, "coerce", None)
-            null_values = getattr(params, "null_values", None)
-            trim_whitespace = getattr(params, "trim_whitespace", True)
-            skip_rows = getattr(params, "skip_rows", 0)
-            limit_rows = getattr(params, "limit_rows", None)
-            on_error = getattr(params, "on_error", "skip")
-            extra_fields_policy = getattr(params, "extra_fields_policy", "keep")
-            schema_version = getattr(params, "schema_version", None)
-        else:
-            params_dict = params if isinstance(params, dict) else {}
-            delimiter = params_dict.get("delimiter", ",")
-            quotechar = params_dict.get("quotechar", '"')
-            escapechar = params_dict.get("escapechar")
-            encoding = params_dict.get("encoding", "utf-8")
-            line_separator = params_dict.get("line_separator", "\n")
-            has_header = params_dict.get("has_header", True)
-            headers = params_dict.get("headers")
-            include = params_dict.get("include")
-            rename = params_dict.get("rename")
-            coerce = params_dict.get("coerce")
-            null_values = params_dict.get("null_values")
-            trim_whitespace = params_dict.get("trim_whitespace", True)
-            skip_rows = params_dict.get("skip_rows", 0)
-            limit_rows = params_dict.get("limit_rows")
-            on_error = params_dict.get("on_error", "skip")
-            extra_fields_policy = params_dict.get("extra_fields_policy", "keep")
-            schema_version = params_dict.get("schema_version")
-
-        return CsvResourceParser(
-            delimiter=delimiter,
-            quotechar=quotechar,
-            escapechar=escapechar,
-            encoding=encoding,
-            line_separator=line_separator,
-            has_header=has_header,
-            headers=headers,
-            include=include,
-            rename=rename,
-            coerce=coerce,
-            null_values=null_values,
-            trim_whitespace=trim_whitespace,
-            skip_rows=skip_rows,
-            limit_rows=limit_rows,
-            on_error=on_error,
-            extra_fields_policy=extra_fields_policy,
-            schema_version=schema_version,
-        )
+        return CsvResourceParser(**_extract_params(params, _CSV_PARAMS))
 
     def get_config_type(self, params: Any) -> type | None:
         """Get the configuration type for further processing.
@@ -154,6 +153,9 @@ class CsvParserFactory(StrategyFactory):
 class FixedWidthParserFactory(StrategyFactory):
     """Factory for creating fixed-width parser instances."""
 
+    # Optional parameters that must be strings when provided
+    _STRING_PARAMS = ("encoding",)
+
     def validate(self, params: Any) -> None:
         """Validate fixed-width parser parameters.
         
@@ -163,16 +165,9 @@ class FixedWidthParserFactory(StrategyFactory):
         Raises:
             InvalidArgumentStrategyException: If validation fails
         """
-        params_dict = params if isinstance(params, dict) else {}
-        
-        # Validate optional parameters if provided
-        if "encoding" in params_dict and not isinstance(params_dict["encoding"], str):
-            raise InvalidArgumentStrategyException(
-                "encoding must be a string",
-                FixedWidthResourceParser,
-                "fixed_width",
-                params,
-            )
+        _validate_string_params(
+            params, self._STRING_PARAMS, FixedWidthResourceParser, "fixed_width"
+        )
 
     def create(self, params: Any) -> FixedWidthResourceParser:
         """Create a fixed-width parser instance.
@@ -183,35 +178,8 @@ class FixedWidthParserFactory(StrategyFactory):
         Returns:
             Created FixedWidthResourceParser instance
         """
-        if is_dataclass(params):
-            encoding = getattr(params, "encoding", "utf-8")
-            line_separator = getattr(params, "line_separator", "\n")
-            field_specs = getattr(params, "field_specs", None)
-            skip_rows = getattr(params, "skip_rows", 0)
-            limit_rows = getattr(params, "limit_rows", None)
-            on_error = getattr(params, "on_error", "skip")
-            schema_version = getattr(params, "schema_version", None)
-            ocid_generator = getattr(params, "ocid_generator", None)
-        else:
-            params_dict = params if isinstance(params, dict) else {}
-            encoding = params_dict.get("encoding", "utf-8")
-            line_separator = params_dict.get("line_separator", "\n")
-            field_specs = params_dict.get("field_specs")
-            skip_rows = params_dict.get("skip_rows", 0)
-            limit_rows = params_dict.get("limit_rows")
-            on_error = params_dict.get("on_error", "skip")
-            schema_version = params_dict.get("schema_version")
-            ocid_generator = params_dict.get("ocid_generator")
-
         return FixedWidthResourceParser(
-            encoding=encoding,
-            line_separator=line_separator,
-            field_specs=field_specs,
-            skip_rows=skip_rows,
-            limit_rows=limit_rows,
-            on_error=on_error,
-            schema_version=schema_version,
-            ocid_generator=ocid_generator,
+            **_extract_params(params, _FIXED_WIDTH_PARAMS)
         )
 
     def get_config_type(self, params: Any) -> type | None:
@@ -0,0 +1,136 @@
+"""Tests for async stream utilities.
+
+This module contains unit tests for the async helpers used to move data
+between the pipeline bus and the synchronous parser output.
+"""
+
+import asyncio
+import io
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from data_parser_core.async_utils import (
+    TEXT_BATCH_LINES,
+    AsyncQueueSink,
+    async_bytes_to_text_stream,
+)
+
+
+async def byte_chunks(*chunks: bytes) -> AsyncGenerator[bytes]:
+    """Yield the given chunks as an async byte stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+async def text_batches(*chunks: bytes) -> list[list[str]]:
+    """Decode the given chunks and return the line batches produced."""
+    return [batch async for batch in async_bytes_to_text_stream(byte_chunks(*chunks))]
+
+
+class TestAsyncBytesToTextStream:
+    """Test decoding byte chunks into batches of text lines."""
+
+    @pytest.mark.asyncio
+    async def test_lines_split_across_chunks(self) -> None:
+        batches = await text_batches(b"na", b"me,age\nJo", b"hn,30\n", b"Jane,25")
+
+        assert batches == [["name,age", "John,30", "Jane,25"]]
+
+    @pytest.mark.asyncio
+    async def test_multibyte_character_split_across_chunks(self) -> None:
+        data = "caf\u00e9,\u20ac5\nna\u00efve\n".encode()
+        # Split inside the two-byte \u00e9 and the three-byte \u20ac
+        chunks = (data[:4], data[4:7], data[7:8], data[8:])
+
+        assert await text_batches(*chunks) == [["caf\u00e9,\u20ac5", "na\u00efve"]]
+
+    @pytest.mark.asyncio
+    async def test_invalid_bytes_replaced(self) -> None:
+        assert await text_batches(b"ok\n\xff\n") == [["ok", "\ufffd"]]
+
+    @pytest.mark.asyncio
+    async def test_empty_stream(self) -> None:
+        assert await text_batches() == []
+        assert await text_batches(b"") == []
+
+    @pytest.mark.asyncio
+    async def test_lines_batched(self) -> None:
+        # One line per chunk, so batches fill up line by line
+        total = TEXT_BATCH_LINES * 2 + 3
+        chunks = [f"{i}\n".encode() for i in range(total)]
+
+        batches = await text_batches(*chunks)
+
+        assert [len(batch) for batch in batches] == [
+            TEXT_BATCH_LINES,
+            TEXT_BATCH_LINES,
+            3,
+        ]
+        assert [line for batch in batches for line in batch] == [
+            str(i) for i in range(total)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_large_chunk_yields_one_batch(self) -> None:
+        total = TEXT_BATCH_LINES * 3
+        data = "".join(f"{i}\n" for i in range(total)).encode()
+
+        batches = await text_batches(data)
+
+        # Batches hold at least TEXT_BATCH_LINES lines, never split a chunk
+        assert len(batches) == 1
+        assert len(batches[0]) == total
+
+
+class TestAsyncQueueSink:
+    """Test the queue-backed output sink."""
+
+    def test_write_enqueues_copy(self) -> None:
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        sink = AsyncQueueSink(queue, max_pending=4)
+        data = bytearray(b"abc")
+
+        assert sink.write(data) == 3
+        data[:] = b"xyz"
+
+        assert queue.get_nowait() == b"abc"
+
+    def test_buffered_writer_emits_chunks(self) -> None:
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        writer = io.BufferedWriter(AsyncQueueSink(queue, max_pending=4), 4)
+
+        writer.write(b"ab")
+        assert queue.empty()
+        writer.write(b"cdef")
+        writer.flush()
+
+        chunks = []
+        while not queue.empty():
+            chunks.append(queue.get_nowait())
+        assert b"".join(chunk or b"" for chunk in chunks) == b"abcdef"
+
+    @pytest.mark.asyncio
+    async def test_drain_returns_while_under_limit(self) -> None:
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        sink = AsyncQueueSink(queue, max_pending=2)
+        sink.write(b"a")
+        sink.write(b"b")
+
+        await asyncio.wait_for(sink.drain(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_consumer(self) -> None:
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+        sink = AsyncQueueSink(queue, max_pending=1)
+        sink.write(b"a")
+        sink.write(b"b")
+
+        drain = asyncio.create_task(sink.drain())
+        await asyncio.sleep(0)
+        assert not drain.done()
+
+        for _ in range(2):
+            await queue.get()
+            queue.task_done()
+        await asyncio.wait_for(drain, timeout=1)
@@ -5,16 +5,78 @@ including async streaming functionality and work queue processing.
 """
 
 import asyncio
+import csv
+import gc
 import io
 import json
+import re
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from data_parser_core.jsonl_stream import JSONLStream
-from data_parser_core.parser import process_resource_worker, run_parser
-from data_parser_core.strategies.csv_parser import CsvResourceParser
+from data_parser_core.async_utils import async_bytes_to_text_stream
+from data_parser_core.exceptions import BundleError, ConfigurationError
+from data_parser_core.jsonl_stream import WRITE_BATCH_BYTES, JSONLStream
+from data_parser_core.parser import (
+    OUTPUT_QUEUE_CHUNKS,
+    UPLOAD_PROGRESS_LOG_BYTES,
+    process_resource,
+    run_parser,
+    throttled_upload_progress,
+)
+from data_parser_core.strategies.csv_parser import CsvResourceParser, _split_rows
 from data_parser_core.strategies.fixed_width_parser import FixedWidthResourceParser
+from data_parser_core.strategy_types import ResourceParserStrategy
+
+# Layout of the fields checked in the US_FL sample record (1-based starts)
+US_FL_FIELD_SPECS = [
+    {"name": "COR_NUMBER", "start": 1, "length": 12},
+    {"name": "COR_NAME", "start": 13, "length": 96},
+    {"name": "COR_STATUS", "start": 109, "length": 5},
+    {"name": "COR_FILE_DATE", "start": 115, "length": 8},
+    {"name": "COR_PRINC_ADD_1", "start": 123, "length": 51},
+    {"name": "COR_PRINC_CITY", "start": 224, "length": 31},
+    {"name": "COR_PRINC_ZIP", "start": 255, "length": 10},
+    {"name": "RA_NAME", "start": 409, "length": 50},
+    {"name": "RA_NAME_TYPE", "start": 459, "length": 1},
+    {"name": "PRINC1_TITLE", "start": 547, "length": 4},
+    {"name": "PRINC1_NAME_TYPE", "start": 551, "length": 1},
+    {"name": "PRINC1_NAME", "start": 552, "length": 45},
+    {"name": "STATE_COUNTRY", "start": 1374, "length": 2},
+    {"name": "RetrievedAt", "start": 1376, "length": 8},
+]
+
+COR_NUMBER_FIELD_SPECS = [{"name": "COR_NUMBER", "start": 1, "length": 12}]
+
+
+async def byte_chunks(*chunks: bytes) -> AsyncGenerator[bytes]:
+    """Yield the given chunks as an async resource byte stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+def text_stream(text: str) -> AsyncGenerator[list[str]]:
+    """Stream ``text`` through the same decoding as pipeline bus resources."""
+    return async_bytes_to_text_stream(byte_chunks(text.encode("utf-8")))
+
+
+async def line_batches(*batches: list[str]) -> AsyncGenerator[list[str]]:
+    """Yield the given batches of text lines as an async input stream."""
+    for batch in batches:
+        yield batch
+
+
+async def parse_batches(parser: Any, *batches: list[str]) -> list[dict[str, Any]]:
+    """Stream parse batches of lines and return the records written."""
+    output = io.BytesIO()
+    jsonl_stream = JSONLStream(output)
+    async for _ in parser.parse_stream(line_batches(*batches), jsonl_stream):
+        pass
+    jsonl_stream.flush()
+    return [json.loads(line) for line in output.getvalue().splitlines()]
 
 
 class TestJSONLStream:
@@ -22,19 +84,20 @@ class TestJSONLStream:
 
     def test_write_record(self) -> None:
         """Test writing a single record."""
-        output = io.StringIO()
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
         record = {"name": "test", "value": 123}
         jsonl_stream.write_record(record)
+        jsonl_stream.flush()
 
-        expected = '{"name": "test", "value": 123}\n'
+        expected = b'{"name":"test","value":123}\n'
         assert output.getvalue() == expected
         assert jsonl_stream.get_records_written() == 1
 
     def test_write_multiple_records(self) -> None:
         """Test writing multiple records."""
-        output = io.StringIO()
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
         records = [
@@ -42,14 +105,15 @@ class TestJSONLStream:
             {"name": "test2", "value": 456},
         ]
         jsonl_stream.write_records(records)
+        jsonl_stream.flush()
 
-        expected = '{"name": "test1", "value": 123}\n{"name": "test2", "value": 456}\n'
+        expected = b'{"name":"test1","value":123}\n{"name":"test2","value":456}\n'
         assert output.getvalue() == expected
         assert jsonl_stream.get_records_written() == 2
 
     def test_records_written_counter(self) -> None:
         """Test that records written counter is accurate."""
-        output = io.StringIO()
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
         assert jsonl_stream.get_records_written() == 0
@@ -60,6 +124,54 @@ class TestJSONLStream:
         jsonl_stream.write_record({"test2": "value2"})
         assert jsonl_stream.get_records_written() == 2
 
+    def test_output_buffered_until_flush(self) -> None:
+        """Test that records reach the output stream only when flushed."""
+        output = io.BytesIO()
+        jsonl_stream = JSONLStream(output)
+
+        jsonl_stream.write_records([{"test": "value"}] * 100)
+        assert output.getvalue() == b""
+
+        jsonl_stream.flush()
+        assert output.getvalue() == b'{"test":"value"}\n' * 100
+
+    def test_close_leaves_output_open(self) -> None:
+        """Test that closing flushes the records but not the output stream."""
+        output = io.BytesIO()
+        jsonl_stream = JSONLStream(output)
+
+        jsonl_stream.write_record({"test": "value"})
+        jsonl_stream.close()
+        jsonl_stream.close()
+
+        assert not output.closed
+        assert output.getvalue() == b'{"test":"value"}\n'
+
+    def test_garbage_collection_leaves_output_open(self) -> None:
+        """Test that a discarded stream does not close the output stream."""
+        output = io.BytesIO()
+        jsonl_stream = JSONLStream(output)
+        jsonl_stream.write_record({"test": "value"})
+
+        del jsonl_stream
+        gc.collect()
+
+        assert not output.closed
+        assert output.getvalue() == b'{"test":"value"}\n'
+
+
+class TestResourceParserStrategy:
+    """Test that the parsers satisfy the resource parser protocol."""
+
+    def test_parsers_conform(self) -> None:
+        # The annotation has mypy check conformance; isinstance checks it at runtime
+        parsers: list[ResourceParserStrategy] = [
+            CsvResourceParser(),
+            FixedWidthResourceParser(),
+        ]
+
+        assert all(isinstance(parser, ResourceParserStrategy) for parser in parsers)
+
 
 class TestCsvResourceParserAsync:
     """Test CSV parser async streaming functionality."""
@@ -69,8 +181,8 @@ class TestCsvResourceParserAsync:
         """Test basic async streaming CSV parsing."""
         # Create test CSV data
         csv_data = "name,age,city\nJohn,30,NYC\nJane,25,LA"
-        input_stream = io.BytesIO(csv_data.encode("utf-8"))
-        output = io.StringIO()
+        input_stream = text_stream(csv_data)
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
         parser = CsvResourceParser()
@@ -81,7 +193,8 @@ class TestCsvResourceParserAsync:
             progress_updates.append(records_written)
 
         # Verify output
-        lines = output.getvalue().strip().split("\n")
+        jsonl_stream.flush()
+        lines = output.getvalue().decode("utf-8").strip().split("\n")
         assert len(lines) == 2
 
         # Parse first record
@@ -104,20 +217,20 @@ class TestCsvResourceParserAsync:
     async def test_parse_stream_with_config(self) -> None:
         """Test async streaming with configuration options."""
         csv_data = "name,age\nJohn,30\nJane,25"
-        input_stream = io.BytesIO(csv_data.encode("utf-8"))
-        output = io.StringIO()
+        input_stream = text_stream(csv_data)
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
-        parser = CsvResourceParser()
-        config = {
-            "rename": {"name": "full_name"},
-            "coerce": {"age": "int"},
-        }
+        parser = CsvResourceParser(
+            rename={"name": "full_name"},
+            coerce={"age": "int"},
+        )
 
-        async for _ in parser.parse_stream(input_stream, jsonl_stream, config):
+        async for _ in parser.parse_stream(input_stream, jsonl_stream):
             pass
 
-        lines = output.getvalue().strip().split("\n")
+        jsonl_stream.flush()
+        lines = output.getvalue().decode("utf-8").strip().split("\n")
         record1 = json.loads(lines[0])
         assert record1["full_name"] == "John"  # Renamed field
         assert record1["age"] == 30  # Coerced to int
@@ -125,8 +238,8 @@ class TestCsvResourceParserAsync:
     @pytest.mark.asyncio
     async def test_parse_stream_empty_input(self) -> None:
         """Test async streaming with empty input."""
-        input_stream = io.BytesIO(b"")
-        output = io.StringIO()
+        input_stream = text_stream("")
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
         parser = CsvResourceParser()
@@ -135,9 +248,239 @@ class TestCsvResourceParserAsync:
         async for records_written in parser.parse_stream(input_stream, jsonl_stream):
             progress_updates.append(records_written)
 
-        assert output.getvalue() == ""
+        jsonl_stream.flush()
+        assert output.getvalue() == b""
         assert len(progress_updates) == 0
 
+    @pytest.mark.asyncio
+    async def test_parse_stream_quoted_field_across_batches(self) -> None:
+        """Test that a multi-line quoted field may span input batches."""
+        records = await parse_batches(
+            CsvResourceParser(),
+            ["a,b,c", 'x,"first', "second"],
+            ['third",y', "p,q,r"],
+        )
+
+        assert records == [
+            {"a": "x", "b": "first\nsecond\nthird", "c": "y"},
+            {"a": "p", "b": "q", "c": "r"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_parse_stream_stray_quote_in_unquoted_field(self) -> None:
+        """Test that a quote inside an unquoted field does not open a quote."""
+        records = await parse_batches(
+            CsvResourceParser(),
+            ["a,b,c", 'x,5" pipe,y', 'z,"multi'],
+            ['line",w', "q,r,s"],
+        )
+
+        assert records == [
+            {"a": "x", "b": '5" pipe', "c": "y"},
+            {"a": "z", "b": "multi\nline", "c": "w"},
+            {"a": "q", "b": "r", "c": "s"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_parse_stream_escaped_quotes(self) -> None:
+        """Test that escaped quotes neither end nor open a quoted field."""
+        records = await parse_batches(
+            CsvResourceParser(escapechar="\\"),
+            ["a,b", '"say \\"hi\\"",1', '"open \\"', "still open"],
+            ['closed",2'],
+        )
+
+        assert records == [
+            {"a": 'say "hi"', "b": "1"},
+            {"a": 'open "\nstill open\nclosed', "b": "2"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_parse_stream_unterminated_quote_at_end(self) -> None:
+        """Test that an unterminated quoted field is kept at the end of input."""
+        records = await parse_batches(
+            CsvResourceParser(), ["a,b", '1,"open'], ["rest"]
+        )
+
+        assert records == [{"a": "1", "b": "open\nrest"}]
+
+    @pytest.mark.asyncio
+    async def test_parse_stream_limit_rows(self) -> None:
+        """Test that parsing stops once limit_rows records are written."""
+        records = await parse_batches(
+            CsvResourceParser(limit_rows=1), ["a", "1", "2"], ["3"]
+        )
+
+        assert records == [{"a": "1"}]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("escapechar", [None, "\\"])
+    async def test_parse_stream_quoted_field_over_many_batches(
+        self, escapechar: str | None
+    ) -> None:
+        """Test that a quoted field may span batches holding no quote."""
+        records = await parse_batches(
+            CsvResourceParser(escapechar=escapechar),
+            ["a,b", '1,"open'],
+            ["more"],
+            ["", "still"],
+            ['closed"', "3,4"],
+        )
+
+        assert records == [
+            {"a": "1", "b": "open\nmore\n\nstill\nclosed"},
+            {"a": "3", "b": "4"},
+        ]
+
+
+# Quote-free lines around quoted, multi-line quoted and oddly quoted rows
+MIXED_QUOTING_CSV = (
+    "id,name,note\n"
+    "1,plain,no quotes\n"
+    '2,"quoted, with delimiter",x\n'
+    '3,"multi\nline ""quoted""\n\nfield",y\n'
+    "4,after,multi-line\n"
+    '5,stray"quote,z\n'
+    '6,"",""\n'
+    '7,"a"b,c\n'
+    "8,last,no newline"
+)
+
+SPLIT_ROWS_CASES = [
+    MIXED_QUOTING_CSV,
+    MIXED_QUOTING_CSV.replace("\n", "\r\n"),
+    "a,b\n\n1,2\n\r\n",
+    'a,b\n"1\n",2\n\n3,4\n',
+    "a,b\n1,\n,2\n",
+]
+
+
+def parse_file(tmp_path: Path, parser: CsvResourceParser, data: str) -> list[Any]:
+    """Parse ``data`` from a file and return the records written."""
+    path = tmp_path / "input.csv"
+    path.write_bytes(data.encode("utf-8"))
+    output = io.BytesIO()
+    records_written = parser.parse(str(path), output)
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert records_written == len(records)
+    return records
+
+
+class TestCsvResourceParserParse:
+    """Test CSV file parsing, which splits quote-free lines without csv.reader."""
+
+    @pytest.mark.parametrize("line_break", ["\n", "\r\n"])
+    def test_rows_match_csv_reader(self, tmp_path: Path, line_break: str) -> None:
+        data = MIXED_QUOTING_CSV.replace("\n", line_break)
+        # Keep every field verbatim so records map 1:1 onto reader rows
+        parser = CsvResourceParser(trim_whitespace=False, null_values=["NULL"])
+
+        records = parse_file(tmp_path, parser, data)
+
+        rows = list(csv.reader(io.StringIO(data, newline="")))
+        assert [
+            [value for key, value in record.items() if key != "oc:source_row"]
+            for record in records
+        ] == rows[1:]
+        assert records[2]["name"] == line_break.join(
+            ["multi", 'line "quoted"', "", "field"]
+        )
+        assert [record["oc:source_row"] for record in records] == [
+            str(row) for row in range(2, 10)
+        ]
+
+    @pytest.mark.parametrize("data", SPLIT_ROWS_CASES)
+    def test_split_rows_matches_csv_reader(self, data: str) -> None:
+        rows = _split_rows(io.StringIO(data, newline=""), ",", '"')
+
+        assert list(rows) == list(csv.reader(io.StringIO(data, newline="")))
+
+    @pytest.mark.parametrize("data", SPLIT_ROWS_CASES)
+    def test_matches_csv_reader_path(self, tmp_path: Path, data: str) -> None:
+        # An escape character absent from the input routes every row
+        # through csv.reader
+        fast = parse_file(tmp_path, CsvResourceParser(), data)
+        reference = parse_file(tmp_path, CsvResourceParser(escapechar="\\"), data)
+
+        assert fast == reference
+
+    def test_parse_to_text_stream(self, tmp_path: Path) -> None:
+        path = tmp_path / "input.csv"
+        path.write_text("name,city\nJos\u00e9,M\u00e1laga\n", encoding="utf-8")
+        binary = io.BytesIO()
+        text = io.StringIO()
+
+        assert CsvResourceParser().parse(str(path), binary) == 1
+        assert CsvResourceParser().parse(str(path), text) == 1
+
+        assert text.getvalue() == binary.getvalue().decode("utf-8")
+        assert text.getvalue() == (
+            '{"name":"Jos\u00e9","city":"M\u00e1laga","oc:source_row":"2"}\n'
+        )
+
+    def test_parse_iter_does_not_swallow_thrown_errors(self, tmp_path: Path) -> None:
+        path = tmp_path / "input.csv"
+        # Enough rows to fill more than one output chunk
+        path.write_text("a\n" + "x\n" * (WRITE_BATCH_BYTES // 16))
+        chunks = CsvResourceParser(on_error="skip").parse_iter(str(path))
+        next(chunks)
+
+        with pytest.raises(RuntimeError, match="consumer failed"):
+            chunks.throw(RuntimeError("consumer failed"))
+
+
+# Rows with padding, null markers, missing cells and a value failing coercion
+TRANSFORM_CSV = (
+    "id,name,note,extra\n"
+    "1, padded ,NA,e1\n"
+    "2,short\n"
+    'x,bad id,"multi\nline",e3\n'
+    "4,,NULL,\n"
+    "5,last,  ,e5\n"
+)
+
+TRANSFORM_CONFIGS = [
+    {},
+    {"include": ["id", "note"], "rename": {"note": "comment"}},
+    {"coerce": {"id": "int"}},
+    {"coerce": {"id": "int"}, "rename": {"id": "number"}},
+    {"null_values": ["NA"], "trim_whitespace": False},
+    {"extra_fields_policy": "drop", "rename": {"name": "full_name"}},
+    {"skip_rows": 1, "limit_rows": 2, "schema_version": "v2"},
+]
+
+
+class TestCsvResourceParserParity:
+    """Test that file and stream parsing transform rows alike."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("config", TRANSFORM_CONFIGS)
+    async def test_parse_matches_parse_stream(
+        self, tmp_path: Path, config: dict[str, Any]
+    ) -> None:
+        lines = TRANSFORM_CSV.splitlines()
+
+        parsed = parse_file(tmp_path, CsvResourceParser(**config), TRANSFORM_CSV)
+        # The quoted field spans the two batches
+        streamed = await parse_batches(
+            CsvResourceParser(**config), lines[:4], lines[4:]
+        )
+
+        # Only file parsing records the source row
+        assert [
+            {key: value for key, value in record.items() if key != "oc:source_row"}
+            for record in parsed
+        ] == streamed
+        assert streamed
+
+    @pytest.mark.asyncio
+    async def test_coercion_failure_skips_row(self) -> None:
+        parser = CsvResourceParser(coerce={"id": "int"}, include=["id"])
+
+        streamed = await parse_batches(parser, TRANSFORM_CSV.splitlines())
+
+        assert streamed == [{"id": 1}, {"id": 2}, {"id": 4}, {"id": 5}]
+
 
 class TestFixedWidthResourceParserAsync:
     """Test Fixed-width parser async streaming functionality."""
@@ -219,11 +562,11 @@ class TestFixedWidthResourceParserAsync:
             + "20250127"  # STATE_COUNTRY + RetrievedAt
         )
 
-        input_stream = io.BytesIO(fixed_width_data.encode("utf-8"))
-        output = io.StringIO()
+        input_stream = text_stream(fixed_width_data)
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
-        parser = FixedWidthResourceParser()
+        parser = FixedWidthResourceParser(field_specs=US_FL_FIELD_SPECS)
 
         # Collect progress updates
         progress_updates = []
@@ -231,7 +574,8 @@ class TestFixedWidthResourceParserAsync:
             progress_updates.append(records_written)
 
         # Verify output
-        lines = output.getvalue().strip().split("\n")
+        jsonl_stream.flush()
+        lines = output.getvalue().decode("utf-8").strip().split("\n")
         assert len(lines) == 1
 
         # Parse the record
@@ -262,23 +606,24 @@ class TestFixedWidthResourceParserAsync:
         # Create minimal test data
         fixed_width_data = "L25000418660" + " " * 200  # Just enough for basic fields
 
-        input_stream = io.BytesIO(fixed_width_data.encode("utf-8"))
-        output = io.StringIO()
+        input_stream = text_stream(fixed_width_data)
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
-        parser = FixedWidthResourceParser()
-        config = {
-            "schema_version": "v1.0",
-            "ocid_generator": {
+        parser = FixedWidthResourceParser(
+            field_specs=COR_NUMBER_FIELD_SPECS,
+            schema_version="v1.0",
+            ocid_generator={
                 "jurisdiction_code": "us_fl",
                 "company_number_field": "COR_NUMBER",
             },
-        }
+        )
 
-        async for _ in parser.parse_stream(input_stream, jsonl_stream, config):
+        async for _ in parser.parse_stream(input_stream, jsonl_stream):
             pass
 
-        lines = output.getvalue().strip().split("\n")
+        jsonl_stream.flush()
+        lines = output.getvalue().decode("utf-8").strip().split("\n")
         record = json.loads(lines[0])
         assert record["_schema_version"] == "v1.0"
         assert record["oc:ocid"].startswith("ocid:v1:co:")
@@ -299,17 +644,20 @@ class TestFixedWidthResourceParserAsync:
             + " " * 200  # Line 3
         )
 
-        input_stream = io.BytesIO(fixed_width_data.encode("utf-8"))
-        output = io.StringIO()
+        input_stream = text_stream(fixed_width_data)
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
-        parser = FixedWidthResourceParser()
-        config = {"skip_rows": 1}  # Skip first line
+        parser = FixedWidthResourceParser(
+            field_specs=COR_NUMBER_FIELD_SPECS,
+            skip_rows=1,  # Skip first line
+        )
 
-        async for _ in parser.parse_stream(input_stream, jsonl_stream, config):
+        async for _ in parser.parse_stream(input_stream, jsonl_stream):
             pass
 
-        lines = output.getvalue().strip().split("\n")
+        jsonl_stream.flush()
+        lines = output.getvalue().decode("utf-8").strip().split("\n")
         assert len(lines) == 2  # Should process 2 lines (skip first)
 
         # Check that we got the correct lines
@@ -320,6 +668,48 @@ class TestFixedWidthResourceParserAsync:
         assert record1["oc:source_row"] == "2"  # Line number should be 2
         assert record2["oc:source_row"] == "3"  # Line number should be 3
 
+    @pytest.mark.asyncio
+    async def test_parse_stream_blake2b_ocid(self) -> None:
+        """Test OCID generation with the BLAKE2b hash algorithm."""
+        parser = FixedWidthResourceParser(
+            field_specs=COR_NUMBER_FIELD_SPECS,
+            ocid_generator={"jurisdiction_code": "us_fl", "hash_algorithm": "blake2b"},
+        )
+
+        records = await parse_batches(parser, ["L25000418660"])
+
+        assert re.fullmatch("ocid:v1:co:[0-9a-f]{16}", records[0]["oc:ocid"])
+
+    @pytest.mark.asyncio
+    async def test_parse_stream_unknown_hash_algorithm(self) -> None:
+        """Test that an unsupported OCID hash algorithm is rejected."""
+        parser = FixedWidthResourceParser(
+            field_specs=COR_NUMBER_FIELD_SPECS,
+            ocid_generator={"jurisdiction_code": "us_fl", "hash_algorithm": "blake2"},
+        )
+
+        with pytest.raises(ValueError, match="'blake2'"):
+            await parse_batches(parser, ["L25000418660"])
+
+    @pytest.mark.parametrize("output", [io.BytesIO, io.StringIO])
+    def test_parse_to_binary_or_text_stream(
+        self, tmp_path: Path, output: type[io.BytesIO] | type[io.StringIO]
+    ) -> None:
+        """Test that parse writes JSONL to binary and text streams alike."""
+        path = tmp_path / "input.txt"
+        path.write_text("L25000418660\nL25000418661\n")
+        parser = FixedWidthResourceParser(field_specs=COR_NUMBER_FIELD_SPECS)
+        write_stream = output()
+
+        assert parser.parse(str(path), write_stream) == 2
+
+        value = write_stream.getvalue()
+        text = value.decode("utf-8") if isinstance(value, bytes) else value
+        assert [json.loads(line)["COR_NUMBER"] for line in text.splitlines()] == [
+            "L25000418660",
+            "L25000418661",
+        ]
+
     @pytest.mark.asyncio
     async def test_parse_stream_limit_rows(self) -> None:
         """Test async streaming with row limiting."""
@@ -335,17 +725,20 @@ class TestFixedWidthResourceParserAsync:
             + " " * 200  # Line 3
         )
 
-        input_stream = io.BytesIO(fixed_width_data.encode("utf-8"))
-        output = io.StringIO()
+        input_stream = text_stream(fixed_width_data)
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
-        parser = FixedWidthResourceParser()
-        config = {"limit_rows": 2}  # Limit to 2 rows
+        parser = FixedWidthResourceParser(
+            field_specs=COR_NUMBER_FIELD_SPECS,
+            limit_rows=2,  # Limit to 2 rows
+        )
 
-        async for _ in parser.parse_stream(input_stream, jsonl_stream, config):
+        async for _ in parser.parse_stream(input_stream, jsonl_stream):
             pass
 
-        lines = output.getvalue().strip().split("\n")
+        jsonl_stream.flush()
+        lines = output.getvalue().decode("utf-8").strip().split("\n")
         assert len(lines) == 2  # Should process only 2 lines
 
         # Check that we got the correct lines
@@ -357,20 +750,85 @@ class TestFixedWidthResourceParserAsync:
     @pytest.mark.asyncio
     async def test_parse_stream_empty_input(self) -> None:
         """Test async streaming with empty input."""
-        input_stream = io.BytesIO(b"")
-        output = io.StringIO()
+        input_stream = text_stream("")
+        output = io.BytesIO()
         jsonl_stream = JSONLStream(output)
 
-        parser = FixedWidthResourceParser()
+        parser = FixedWidthResourceParser(field_specs=COR_NUMBER_FIELD_SPECS)
 
         progress_updates = []
         async for records_written in parser.parse_stream(input_stream, jsonl_stream):
             progress_updates.append(records_written)
 
-        assert output.getvalue() == ""
+        jsonl_stream.flush()
+        assert output.getvalue() == b""
         assert len(progress_updates) == 0
 
 
+def streaming_bus(*chunks: bytes) -> MagicMock:
+    """Create a pipeline bus mock whose resource stream yields ``chunks``."""
+    bus = MagicMock()
+    bus.get_bundle_resource_stream = MagicMock(
+        side_effect=lambda *_: byte_chunks(*chunks)
+    )
+    return bus
+
+
+def parser_config(*routes: tuple[str, Any], concurrency: int = 2) -> MagicMock:
+    """Create a parser config routing resources matching each pattern to a parser."""
+    config = MagicMock()
+    config.concurrency = concurrency
+    config.compiled_resource_parsers = []
+    for pattern, parser in routes:
+        # process_resource takes the first key; dataclass parsers are unhashable
+        parser_entry = MagicMock()
+        parser_entry.keys.return_value = [parser]
+        config.compiled_resource_parsers.append((re.compile(pattern), parser_entry))
+    return config
+
+
+def collecting_uploader(uploaded: dict[str, bytes]) -> AsyncMock:
+    """Create an upload mock storing each streamed resource in ``uploaded``."""
+
+    async def upload(
+        bid: str, name: str, metadata: dict[str, Any], stream: Any, **_: Any
+    ) -> None:
+        uploaded[name] = b"".join([chunk async for chunk in stream])
+
+    return AsyncMock(side_effect=upload)
+
+
+class EndlessParser:
+    """Parser emitting one output chunk per progress update until stopped."""
+
+    def __init__(self) -> None:
+        self.chunks_written = 0
+        self.stopped = asyncio.Event()
+
+    async def parse_stream(
+        self, async_input_stream: Any, jsonl_stream: JSONLStream
+    ) -> AsyncGenerator[int]:
+        try:
+            while True:
+                jsonl_stream.write_record({"n": self.chunks_written})
+                jsonl_stream.flush()
+                self.chunks_written += 1
+                yield self.chunks_written
+        finally:
+            self.stopped.set()
+
+
+class FailingParser:
+    """Parser writing one record and then failing."""
+
+    async def parse_stream(
+        self, async_input_stream: Any, jsonl_stream: JSONLStream
+    ) -> AsyncGenerator[int]:
+        jsonl_stream.write_record({"n": 1})
+        yield 1
+        raise ValueError("bad input")
+
+
 class TestParserAsync:
     """Test async parser functionality."""
 
@@ -378,42 +836,27 @@ class TestParserAsync:
     async def test_run_parser_basic(self) -> None:
         """Test basic async parser execution."""
         # Mock the pipeline bus
-        mock_bus = MagicMock()
+        mock_bus = streaming_bus(b"name,age\nJohn,30")
         mock_bus.get_change_event.return_value = MagicMock(stage="raw", bid="test-bid")
         mock_bus.get_bundle_metadata_json.return_value = {"test": "metadata"}
         mock_bus.get_bundle_resource_list.return_value = ["test.csv"]
-        mock_bus.get_bundle_resource.return_value = io.BytesIO(b"name,age\nJohn,30")
-        mock_bus.add_bundle_resource_streaming = AsyncMock()
-        mock_bus.complete_bundle = MagicMock()
+        uploaded: dict[str, bytes] = {}
+        mock_bus.add_bundle_resource_streaming = collecting_uploader(uploaded)
 
         # Mock app config
         mock_app_config = MagicMock()
 
         # Mock parser config
-        mock_parser_config = MagicMock()
-        mock_parser_config.concurrency = 2
-        mock_parser_config.resource_parsers = {
-            ".*\\.csv": {"CsvResourceParser": {"delimiter": ",", "has_header": True}}
-        }
-
-        # Mock the strategy registry
-        with patch(
-            "data_parser_core.parser.create_strategy_registry"
-        ) as mock_registry_factory:
-            mock_registry = MagicMock()
-            mock_registry_factory.return_value = mock_registry
-            mock_registry.create.return_value = CsvResourceParser()
-
-            # Mock DataPipelineBus constructor
-            with patch(
-                "data_parser_core.parser.DataPipelineBus", return_value=mock_bus
-            ):
-                await run_parser(
-                    app_config=mock_app_config,
-                    parser_config=mock_parser_config,
-                    data_registry_id="test-registry",
-                    stage="raw",
-                )
+        mock_parser_config = parser_config((".*\\.csv", CsvResourceParser()))
+
+        # Mock DataPipelineBus constructor
+        with patch("data_parser_core.parser.DataPipelineBus", return_value=mock_bus):
+            await run_parser(
+                app_config=mock_app_config,
+                parser_config=mock_parser_config,
+                data_registry_id="test-registry",
+                stage="raw",
+            )
 
         # Verify calls
         mock_bus.get_change_event.assert_called_once()
@@ -421,56 +864,203 @@ class TestParserAsync:
         mock_bus.get_bundle_resource_list.assert_called_once()
         mock_bus.add_bundle_resource_streaming.assert_called_once()
         mock_bus.complete_bundle.assert_called_once()
+        assert json.loads(uploaded["test.csv.jsonl"]) == {"name": "John", "age": "30"}
 
     @pytest.mark.asyncio
-    async def test_process_resource_worker(self) -> None:
-        """Test resource worker processing."""
-        # Create work queue
-        work_queue = asyncio.Queue()
+    async def test_run_parser_collects_resource_failures(self) -> None:
+        """Test that one failing resource does not stop the others."""
+        mock_bus = streaming_bus(b"name,age\nJohn,30")
+        mock_bus.get_change_event.return_value = MagicMock(stage="raw", bid="test-bid")
+        mock_bus.get_bundle_resource_list.return_value = ["bad.csv", "good.csv"]
+        uploaded: dict[str, bytes] = {}
+        mock_bus.add_bundle_resource_streaming = collecting_uploader(uploaded)
 
-        # Mock parser config
-        mock_parser_config = MagicMock()
-        mock_parser_config.resource_parsers = {
-            ".*\\.csv": {"CsvResourceParser": {"delimiter": ",", "has_header": True}}
-        }
-
-        # Add work item
-        await work_queue.put(
-            {
-                "resource_name": "test.csv",
-                "bid": "test-bid",
-                "parser_config": mock_parser_config,
-            }
+        mock_parser_config = parser_config(
+            ("bad\\.csv", FailingParser()),
+            (".*\\.csv", CsvResourceParser()),
         )
 
-        # Mock pipeline bus
-        mock_bus = MagicMock()
-        mock_bus.get_bundle_resource.return_value = io.BytesIO(b"name,age\nJohn,30")
-        mock_bus.add_bundle_resource_streaming = AsyncMock()
-
-        # Mock strategy registry
-        with patch(
-            "data_parser_core.parser.create_strategy_registry"
-        ) as mock_registry_factory:
-            mock_registry = MagicMock()
-            mock_registry_factory.return_value = mock_registry
-            mock_registry.create.return_value = CsvResourceParser()
-
-            # Create worker task
-            worker_task = asyncio.create_task(
-                process_resource_worker(work_queue, mock_bus)
+        with (
+            patch("data_parser_core.parser.DataPipelineBus", return_value=mock_bus),
+            pytest.raises(BundleError, match=r"1 resource\(s\): bad\.csv") as exc_info,
+        ):
+            await run_parser(
+                app_config=MagicMock(),
+                parser_config=mock_parser_config,
+                data_registry_id="test-registry",
+                stage="raw",
             )
 
-            # Wait for work to complete
-            await work_queue.join()
+        assert exc_info.value.bid == "test-bid"
+        assert isinstance(exc_info.value.__cause__, ValueError)
+        assert list(uploaded) == ["good.csv.jsonl"]
+        assert json.loads(uploaded["good.csv.jsonl"]) == {"name": "John", "age": "30"}
+        mock_bus.complete_bundle.assert_not_called()
 
-            # Cancel worker
-            worker_task.cancel()
-            try:
-                await worker_task
-            except asyncio.CancelledError:
-                pass
+    @pytest.mark.asyncio
+    async def test_process_resource(self) -> None:
+        """Test single resource processing."""
+        # Mock parser config
+        mock_parser_config = parser_config((".*\\.csv", CsvResourceParser()))
+
+        # Mock pipeline bus
+        mock_bus = streaming_bus(b"name,age\nJohn,30")
+        mock_bus.add_bundle_resource_streaming = collecting_uploader({})
+
+        await process_resource("test.csv", "test-bid", mock_parser_config, mock_bus)
 
         # Verify calls
-        mock_bus.get_bundle_resource.assert_called_once_with("test-bid", "test.csv")
+        mock_bus.get_bundle_resource_stream.assert_called_once_with(
+            "test-bid", "test.csv"
+        )
         mock_bus.add_bundle_resource_streaming.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_process_resource_without_parser(self) -> None:
+        """Test that a resource matching no pattern is rejected."""
+        mock_parser_config = parser_config((".*\\.txt", CsvResourceParser()))
+        mock_bus = streaming_bus()
+
+        with pytest.raises(ConfigurationError, match="No parser found"):
+            await process_resource("test.csv", "test-bid", mock_parser_config, mock_bus)
+
+        mock_bus.add_bundle_resource_streaming.assert_not_called()
+
+
+class TestCreateOutputStream:
+    """Test streaming parser output to the uploader."""
+
+    @pytest.mark.asyncio
+    async def test_streams_records_until_sentinel(self) -> None:
+        bus = streaming_bus(b"name,age\nJohn,30\nJa", b"ne,25\n")
+        uploaded: list[bytes] = []
+
+        async def upload(*args: Any, **kwargs: Any) -> None:
+            uploaded.append(b"".join([chunk async for chunk in args[3]]))
+
+        bus.add_bundle_resource_streaming = AsyncMock(side_effect=upload)
+        config = parser_config((".*", CsvResourceParser()))
+
+        await process_resource("test.csv", "test-bid", config, bus)
+
+        bus.get_bundle_resource_stream.assert_called_once_with("test-bid", "test.csv")
+        assert [json.loads(line) for line in uploaded[0].splitlines()] == [
+            {"name": "John", "age": "30"},
+            {"name": "Jane", "age": "25"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_parse_error_reaches_uploader(self) -> None:
+        bus = streaming_bus(b"")
+        uploaded: list[bytes] = []
+
+        async def upload(*args: Any, **kwargs: Any) -> None:
+            async for chunk in args[3]:
+                uploaded.append(chunk)
+
+        bus.add_bundle_resource_streaming = AsyncMock(side_effect=upload)
+        config = parser_config((".*", FailingParser()))
+
+        with pytest.raises(ValueError, match="bad input"):
+            await process_resource("test.csv", "test-bid", config, bus)
+
+        # Output written before the failure is not flushed to the uploader
+        assert uploaded == []
+
+    @pytest.mark.asyncio
+    async def test_parse_error_recorded_in_failures(self) -> None:
+        bus = streaming_bus(b"")
+
+        async def upload(*args: Any, **kwargs: Any) -> None:
+            async for _ in args[3]:
+                pass
+
+        bus.add_bundle_resource_streaming = AsyncMock(side_effect=upload)
+        config = parser_config((".*", FailingParser()))
+        failures: list[tuple[str, Exception]] = []
+
+        await process_resource("test.csv", "test-bid", config, bus, failures)
+
+        assert [(name, str(error)) for name, error in failures] == [
+            ("test.csv", "bad input")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_upload_abort_cancels_parse(self) -> None:
+        bus = streaming_bus(b"")
+        parser = EndlessParser()
+
+        async def upload(*args: Any, **kwargs: Any) -> None:
+            stream = args[3]
+            await anext(stream)
+            await stream.aclose()
+            raise ConnectionError("upload aborted")
+
+        bus.add_bundle_resource_streaming = AsyncMock(side_effect=upload)
+        config = parser_config((".*", parser))
+
+        with pytest.raises(ConnectionError):
+            await process_resource("test.csv", "test-bid", config, bus)
+
+        await asyncio.wait_for(parser.stopped.wait(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_parser_waits_for_slow_uploader(self) -> None:
+        bus = streaming_bus(b"")
+        parser = EndlessParser()
+        max_ahead = 0
+
+        async def upload(*args: Any, **kwargs: Any) -> None:
+            nonlocal max_ahead
+            stream = args[3]
+            received = 0
+            while received < 50:
+                await anext(stream)
+                received += 1
+                max_ahead = max(max_ahead, parser.chunks_written - received)
+                # Give the parser every chance to run ahead
+                for _ in range(5):
+                    await asyncio.sleep(0)
+            await stream.aclose()
+
+        bus.add_bundle_resource_streaming = AsyncMock(side_effect=upload)
+        config = parser_config((".*", parser))
+
+        await process_resource("test.csv", "test-bid", config, bus)
+
+        assert 0 < max_ahead <= OUTPUT_QUEUE_CHUNKS + 1
+
+
+class TestThrottledUploadProgress:
+    """Test upload progress log throttling."""
+
+    def test_logs_only_after_byte_threshold(self) -> None:
+        """Test that small increments within the interval are not logged."""
+        with (
+            patch("data_parser_core.parser.time.monotonic", return_value=100.0),
+            patch("data_parser_core.parser.logger") as mock_logger,
+        ):
+            callback = throttled_upload_progress("test.csv")
+            callback(1024)
+            callback(2048)
+            assert mock_logger.info.call_count == 0
+
+            callback(UPLOAD_PROGRESS_LOG_BYTES + 2048)
+            mock_logger.info.assert_called_once_with(
+                "UPLOAD_PROGRESS",
+                resource="test.csv",
+                bytes_uploaded=UPLOAD_PROGRESS_LOG_BYTES + 2048,
+            )
+
+    def test_logs_after_time_interval(self) -> None:
+        """Test that progress is logged once the interval has elapsed."""
+        with (
+            patch(
+                "data_parser_core.parser.time.monotonic", side_effect=[0.0, 1.0, 5.0]
+            ),
+            patch("data_parser_core.parser.logger") as mock_logger,
+        ):
+            callback = throttled_upload_progress("test.csv")
+            callback(10)
+            callback(20)
+            mock_logger.info.assert_called_once()